@@ -0,0 +1,45 @@
+"""
+Food catalog benchmark: workbook compile time and per-keystroke lookups
+Run from the repository root: python benchmarks/bench_catalog.py [lookups]
+"""
+ 
+import os
+import sys
+import time
+ 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ 
+from leptin.catalog import FOOD_DATABASE, FoodCatalog  # noqa: E402
+from leptin.workbook import read_workbook_rows  # noqa: E402
+ 
+# Every prefix typed on the way to a few names, plus misspelt and mid-word queries
+QUERIES = [word[:end] for word in ("שוקולד", "תפוח אדמה", "מלפפון", "קינואה") for end in range(1, len(word) + 1)]
+FUZZY = ["שוקולאד", "מלפפונים", "אדמה", "קנואה"]
+ 
+ 
+def per_lookup_us(catalog, queries, runs):
+    started = time.perf_counter()
+    for _ in range(runs):
+        for query in queries:
+            for food in catalog.search(query):
+                catalog.status(food, 5)
+    return (time.perf_counter() - started) / (runs * len(queries)) * 1e6
+ 
+ 
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    started = time.perf_counter()
+    rows = read_workbook_rows(FOOD_DATABASE)
+    read_time = time.perf_counter() - started
+    started = time.perf_counter()
+    catalog = FoodCatalog(rows)
+    compile_time = time.perf_counter() - started
+ 
+    print(f"{len(catalog.foods)} foods in {len(catalog.stages)} stages")
+    print(f"read workbook: {read_time * 1000:8.2f} ms  compile: {compile_time * 1000:8.2f} ms (once per change)")
+    print(f"prefix lookup + status: {per_lookup_us(catalog, QUERIES, runs):6.2f} us")
+    print(f"trigram lookup + status: {per_lookup_us(catalog, FUZZY, runs):6.2f} us")
+ 
+ 
+if __name__ == "__main__":
+    main()
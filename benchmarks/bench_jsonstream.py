@@ -0,0 +1,51 @@
+"""
+Streamed gist file parsing: every chunk boundary, then speed against json.loads
+Run from the repository root: python benchmarks/bench_jsonstream.py [days]
+"""
+ 
+import json
+import os
+import sys
+ 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ 
+from bench_scoring import best_of, random_logs  # noqa: E402
+from leptin.jsonstream import RAW_CHUNK_SIZE, iter_json_members  # noqa: E402
+ 
+# Numbers cut right after "-", ".", "e" or a sign, strings, literals and nesting
+BOUNDARY_DOC = {
+    "c": {"x": -0.25, "y": 1e-7, "z": 12345.5e+3, "w": [1.5, -2E10, 0.0]},
+    "s": "a.b \"q\" שלום", "n": -17, "t": True, "f": False, "z": None,
+}
+ 
+ 
+def chunked(raw, size):
+    return [raw[start:start + size] for start in range(0, len(raw), size)]
+ 
+ 
+def check_boundaries():
+    raw = json.dumps(BOUNDARY_DOC, ensure_ascii=False).encode("utf-8")
+    descended = {**{("c", key): value for key, value in BOUNDARY_DOC["c"].items()},
+                 **{key: value for key, value in BOUNDARY_DOC.items() if key != "c"}}
+    for size in range(1, len(raw) + 1):
+        assert dict(iter_json_members(chunked(raw, size))) == BOUNDARY_DOC, size
+        assert dict(iter_json_members(chunked(raw, size), descend=("c",))) == descended, size
+    print(f"every chunk size 1-{len(raw)} parses the boundary document exactly")
+ 
+ 
+def main():
+    check_boundaries()
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 3 * 365
+    raw = json.dumps({"user_settings": {}, "daily_logs": random_logs(days)}, ensure_ascii=False, indent=2).encode("utf-8")
+    chunks = chunked(raw, RAW_CHUNK_SIZE)
+    streamed = {key: value for key, value in iter_json_members(chunks, descend=("daily_logs",))}
+    assert len(streamed) == days + 1
+ 
+    loads_time = best_of(5, lambda: json.loads(raw))
+    stream_time = best_of(5, lambda: sum(1 for _ in iter_json_members(chunks, descend=("daily_logs",))))
+    print(f"{days} days, {len(raw) / 1024:.0f} KB in {len(chunks)} chunks")
+    print(f"json.loads {loads_time * 1000:8.2f} ms  streamed {stream_time * 1000:8.2f} ms")
+ 
+ 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Rerun cost benchmark
+Run from the repository root: python benchmarks/bench_rerun.py [reruns]
+ 
+Times two things for the app.py entry script:
+  - script body: executing the (already compiled) script without calling main(),
+    i.e. what Streamlit pays on every rerun before any real work starts
+  - rerun: a full AppTest rerun of the logged-in "today" tab
+"""
+ 
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+ 
+from streamlit.testing.v1 import AppTest
+ 
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY = os.path.join(ROOT, "app.py")
+sys.path.insert(0, ROOT)
+ 
+from leptin.storage import SQLiteStorage  # noqa: E402
+ 
+ 
+def median_ms(samples):
+    return statistics.median(samples) * 1000
+ 
+ 
+def time_script_body(runs):
+    with open(ENTRY, encoding="utf-8") as f:
+        code = compile(f.read(), ENTRY, "exec")
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        exec(code, {"__name__": "bench", "__file__": ENTRY})
+        samples.append(time.perf_counter() - start)
+    return median_ms(samples)
+ 
+ 
+def time_reruns(runs):
+    with tempfile.TemporaryDirectory() as tmp:
+        at = AppTest.from_file(ENTRY, default_timeout=60)
+        at.secrets["PASSWORD"] = "bench"
+        at.secrets["STORAGE_BACKEND"] = "sqlite"
+        at.secrets["SQLITE_PATH"] = os.path.join(tmp, "bench.db")
+        # A started program, so the app opens on the tabs rather than onboarding
+        SQLiteStorage(at.secrets["SQLITE_PATH"], "default").save(
+            {"user_settings": {"start_date": date.today().isoformat(), "track": None}, "daily_logs": {}}
+        )
+        at.run()
+        at.text_input[0].input("bench")
+        at.button[0].click()
+        at.run()
+        if not at.tabs:
+            raise SystemExit("The seeded app did not open on the tabs")
+ 
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            at.run()
+            samples.append(time.perf_counter() - start)
+        if at.exception:
+            raise SystemExit(at.exception[0].message)
+    return median_ms(samples)
+ 
+ 
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    os.chdir(ROOT)
+    body = time_script_body(runs)
+    rerun = time_reruns(runs)
+    print(f"script body: {body:8.2f} ms (median of {runs})")
+    print(f"rerun:       {rerun:8.2f} ms (median of {runs})")
+ 
+ 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Phase rules benchmark: guidelines workbook compile time and per-rerun lookups
+Run from the repository root: python benchmarks/bench_rules.py [lookups]
+"""
+ 
+import os
+import sys
+import time
+ 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ 
+from leptin.rules import GUIDELINES, compile_phase_rules  # noqa: E402
+from leptin.workbook import read_workbook_rows  # noqa: E402
+ 
+ 
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    started = time.perf_counter()
+    rows = read_workbook_rows(GUIDELINES)
+    read_time = time.perf_counter() - started
+    started = time.perf_counter()
+    table = compile_phase_rules(rows)
+    compile_time = time.perf_counter() - started
+ 
+    keys = list(table)
+    started = time.perf_counter()
+    for _ in range(runs):
+        for key in keys:
+            table[key]
+    lookup_time = (time.perf_counter() - started) / (runs * len(keys))
+ 
+    print(f"{len(table)} (week, track) entries from {len(rows)} guideline rows")
+    print(f"read workbook: {read_time * 1000:8.2f} ms  compile: {compile_time * 1000:8.2f} ms (once per change)")
+    print(f"lookup: {lookup_time * 1e9:6.1f} ns")
+ 
+ 
+if __name__ == "__main__":
+    main()
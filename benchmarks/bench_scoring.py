@@ -0,0 +1,71 @@
+"""
+Batch vs scalar scoring benchmark
+Run from the repository root: python benchmarks/bench_scoring.py [days]
+"""
+ 
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+ 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ 
+from leptin.scoring import calculate_score, log_columns, score_columns, score_logs  # noqa: E402
+ 
+ 
+def random_logs(days, seed=0):
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    logs = {}
+    for i in range(days):
+        log = {
+            "water_liters": rng.choice([0, 0.5, 1.5, 2, 2.5, 3, 3.5, 4, 5.5, 6]),
+            "water_before_meals": rng.randint(0, 6),
+            "veggies_50_percent": rng.random() < 0.6,
+            "protein_every_meal": rng.random() < 0.6,
+            "eating_window_hours": rng.randint(0, 16),
+            "fats_count": rng.randint(0, 6),
+            "treat_day": rng.random() < 0.1,
+            "forbidden_food": rng.random() < 0.2
+        }
+        # Old logs may miss fields - both paths must apply the same defaults
+        for field in rng.sample(sorted(log), rng.randint(0, 2)):
+            del log[field]
+        logs[(start + timedelta(days=i)).strftime("%Y-%m-%d")] = log
+    return logs
+ 
+ 
+def best_of(runs, fn):
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+ 
+ 
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    logs = random_logs(days)
+ 
+    scalar = {date: calculate_score(log) for date, log in logs.items()}
+    assert score_logs(logs) == scalar, "batch scores differ from calculate_score"
+ 
+    columns = log_columns(logs)
+    scalar_time = best_of(5, lambda: [calculate_score(log) for log in logs.values()])
+    load_time = best_of(5, lambda: log_columns(logs))
+    batch_time = best_of(5, lambda: score_columns(columns))
+    end_to_end_time = best_of(5, lambda: score_logs(logs))
+ 
+    print(f"{days} days, scores identical")
+    print(f"scalar calculate_score loop: {scalar_time * 1000:8.2f} ms")
+    print(f"log_columns (load):          {load_time * 1000:8.2f} ms")
+    print(f"score_columns (vectorized):  {batch_time * 1000:8.2f} ms")
+    print(f"score_logs (load + score):   {end_to_end_time * 1000:8.2f} ms")
+    print(f"speedup, scoring only:       {scalar_time / batch_time:8.1f}x")
+    print(f"speedup, load + score:       {scalar_time / end_to_end_time:8.1f}x")
+ 
+ 
+if __name__ == "__main__":
+    main()
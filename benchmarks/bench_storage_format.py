@@ -0,0 +1,77 @@
+"""
+Gist month-file format benchmark: legacy indented JSON vs the compact format
+Run from the repository root: python benchmarks/bench_storage_format.py [days]
+ 
+Times encoding and decoding the month files alone, then a whole save
+(building every file of the gist) and a whole load (_data_from_gist_files
+over the gist's files), which also pay for the settings file and DailyLogs.
+"""
+ 
+import json
+import os
+import sys
+from collections import defaultdict
+ 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ 
+from bench_scoring import best_of, random_logs  # noqa: E402
+from leptin.codec import decode_month, encode_month  # noqa: E402
+from leptin.gist import _data_from_gist_files, _month_file, gist_files_from_data  # noqa: E402
+from leptin.logs import DATA_FILE, DEFAULT_LOG, DailyLogs, settings_document  # noqa: E402
+ 
+ 
+def by_month(logs):
+    months = defaultdict(dict)
+    for date, log in logs.items():
+        months[date[:7]][date] = {**DEFAULT_LOG, **log}
+    return months
+ 
+ 
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 3 * 365
+    months = by_month(random_logs(days))
+ 
+    def legacy_encode():
+        return [json.dumps(logs, ensure_ascii=False, indent=2) for logs in months.values()]
+ 
+    def compact_encode():
+        return [encode_month(logs) for logs in months.values()]
+ 
+    legacy, compact = legacy_encode(), compact_encode()
+    decoded = {}
+    for content in compact:
+        decoded.update(decode_month(json.loads(content)))
+    assert decoded == {date: log for logs in months.values() for date, log in logs.items()}
+ 
+    print(f"{days} days in {len(months)} month files")
+    for name, files, encode in (("legacy", legacy, legacy_encode), ("compact", compact, compact_encode)):
+        size = sum(len(content.encode("utf-8")) for content in files)
+        encode_time = best_of(5, encode)
+        decode_time = best_of(5, lambda: [decode_month(json.loads(content)) for content in files])
+        print(f"{name:8} {size / 1024:8.1f} KB  encode {encode_time * 1000:7.2f} ms  "
+              f"decode {decode_time * 1000:7.2f} ms")
+ 
+    data = {"user_settings": {"start_date": min(decoded), "track": "fast", "name": ""},
+            "daily_logs": DailyLogs(decoded)}
+ 
+    def legacy_save():
+        files = {DATA_FILE: json.dumps(settings_document(data), ensure_ascii=False, indent=2)}
+        for month in sorted(data["daily_logs"].months()):
+            files[_month_file(month)] = json.dumps(data["daily_logs"].month(month), ensure_ascii=False, indent=2)
+        return files
+ 
+    def compact_save():
+        return gist_files_from_data(data, full=True)
+ 
+    print("whole gist")
+    for name, save in (("legacy", legacy_save), ("compact", compact_save)):
+        files = {filename: {"content": content} for filename, content in save().items()}
+        loaded = _data_from_gist_files(files)
+        assert {date: log.to_dict() for date, log in loaded["daily_logs"].items()} == decoded
+        save_time = best_of(5, save)
+        load_time = best_of(5, lambda: _data_from_gist_files(files))
+        print(f"{name:8} save {save_time * 1000:7.2f} ms  load {load_time * 1000:7.2f} ms")
+ 
+ 
+if __name__ == "__main__":
+    main()
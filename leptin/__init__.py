@@ -0,0 +1,25 @@
+"""
+The Leptin Method - שיטת הלפטין
+ 
+The app lives here so Streamlit imports it once per process; app.py is only
+the page script that reruns on each interaction.
+ 
+    logs        daily logs with change tracking
+    jsonstream  incremental JSON parsing for large gist files
+    codec       compact month-file encoding
+    gist        GitHub Gist client and file layout
+    savequeue   write-behind saves
+    storage     storage backends and save entry points
+    archive     cold-history archival
+    program     program calendar, phases and copy
+    scoring     daily score, batch scoring, streaks
+    rollups     weekly / program-week / phase / monthly rollups
+    catalog     food catalog compiled from the diet workbook
+    rules       phase rules table compiled from the guidelines workbook
+    workbook    Excel workbook reader
+    auth        password gate
+    ui          stylesheet and HTML building blocks
+    dashboard   client-side dashboard component
+    screens     onboarding, today, history and settings
+    main        page entry point
+"""
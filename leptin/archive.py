@@ -0,0 +1,73 @@
+"""
+Cold-history archival: old months leave the hot document, a summary stays
+ 
+Months that ended more than ARCHIVE_AFTER_WEEKS ago are archived at load:
+their days stay where the backend already keeps them (gist month files,
+SQLite rows) but are no longer loaded. data["archive"] summarises them -
+the last archived date, how many days, the good-day run ending on that
+date and the longest run - and the rollup tables keep counting them, so
+the hot document stays the same size however long the history gets.
+"""
+ 
+import streamlit as st
+from datetime import datetime, timedelta
+ 
+from leptin.logs import day_ordinal, ordinal_date, tracked_logs
+from leptin.scoring import GOOD_DAY_SCORE, get_score
+ 
+ 
+ARCHIVE_AFTER_WEEKS = 8
+ 
+ 
+def archive_horizon(today=None):
+    """First hot date: the start of the month ARCHIVE_AFTER_WEEKS before today"""
+    weeks = int(st.secrets.get("ARCHIVE_AFTER_WEEKS", ARCHIVE_AFTER_WEEKS))
+    day = (today or datetime.now()) - timedelta(weeks=weeks)
+    return day.strftime("%Y-%m-01")
+ 
+ 
+def archived_through(data):
+    """Last archived date, or "" when nothing is archived"""
+    return (data.get("archive") or {}).get("through") or ""
+ 
+ 
+def archived_days(data):
+    return (data.get("archive") or {}).get("days", 0)
+ 
+ 
+def archive_cold_days(data, horizon):
+    """Summarise and drop the loaded days before horizon; returns data
+ 
+    Unsaved days are not in storage yet, so nothing is archived until
+    they are saved - the next load tries again.
+    """
+    logs = tracked_logs(data)
+    cold = logs.before(horizon)
+    if not cold or logs.dirty.intersection(cold):
+        return data
+ 
+    archive = data.get("archive") or {"through": None, "days": 0, "streak_end": 0, "longest": 0}
+    previous = day_ordinal(archive["through"]) if archive["through"] else None
+    through = day_ordinal(horizon) - 1
+    run, longest, last = 0, archive["longest"], None
+    for date in cold:
+        if get_score(date, logs[date]) < GOOD_DAY_SCORE:
+            continue
+        day = day_ordinal(date)
+        if last is not None and day == last + 1:
+            run += 1
+        elif last is None and previous is not None and day == previous + 1:
+            run = archive["streak_end"] + 1
+        else:
+            run = 1
+        last = day
+        longest = max(longest, run)
+ 
+    data["archive"] = {
+        "through": ordinal_date(through),
+        "days": archive["days"] + len(cold),
+        "streak_end": run if last == through else 0,
+        "longest": longest
+    }
+    logs.evict(cold)
+    return data
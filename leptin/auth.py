@@ -0,0 +1,34 @@
+"""
+Password gate
+"""
+ 
+import streamlit as st
+ 
+ 
+def check_password():
+    if "authenticated" not in st.session_state:
+        st.session_state.authenticated = False
+ 
+    if st.session_state.authenticated:
+        return True
+ 
+    st.markdown("""
+    <div class="login-container">
+        <div class="login-logo">
+            <div class="login-logo-icon">🔥</div>
+            <h1 class="login-title">שיטת הלפטין</h1>
+            <p class="login-subtitle">המסע שלך להצלחה מתחיל כאן</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+ 
+    password = st.text_input("", type="password", placeholder="הזן סיסמה", label_visibility="collapsed")
+ 
+    if st.button("כניסה", use_container_width=True):
+        if password == st.secrets.get("PASSWORD", "leptin2024"):
+            st.session_state.authenticated = True
+            st.rerun()
+        else:
+            st.error("סיסמה שגויה")
+ 
+    return False
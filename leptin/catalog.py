@@ -0,0 +1,364 @@
+"""
+Food catalog compiled from the diet database workbook
+ 
+"Aba Hatuv Leptin Diet and Training Database.xlsx" has one row per program
+stage (week range, optionally a week-9+ track) with the rules as English
+prose. Compiling reads the permitted-foods, instructions and guidelines
+columns clause by clause, finds the foods of FOOD_VOCABULARY in them and
+gives each stage an allowed / limited / forbidden status per food. Stages
+inherit from the one before, so a food forbidden in week 3 stays forbidden
+until a later row says otherwise. Names are searched through a prefix
+index (every prefix of every name and word) with a trigram index as the
+fallback for mid-word and misspelt queries.
+ 
+Groups the workbook names ("legumes", "all cleansing vegetables") speak
+for each of their foods. The program's own lists are applied on top of
+the workbook: CLEANING_VEGGIES marks cleansing vegetables, and the cleanse
+card's CLEANSE_FORBIDDEN / CLEANSE_ALLOWED hold in the cleanse weeks, so
+the lookup and the card on the same screen give the same answer.
+"""
+ 
+import streamlit as st
+from collections import Counter, namedtuple
+import os
+import re
+ 
+from leptin.program import CLEANING_VEGGIES, CLEANSE_ALLOWED, CLEANSE_FORBIDDEN, get_phase
+from leptin.ui import STATIC_DIR
+from leptin.workbook import read_workbook_rows
+ 
+ 
+FOOD_DATABASE = os.path.join(os.path.dirname(STATIC_DIR), "Aba Hatuv Leptin Diet and Training Database.xlsx")
+ 
+# (id, English pattern, Hebrew name, Hebrew aliases) - longer patterns win
+# where they overlap, so "sweet potato" is not also a "potato"
+FOOD_VOCABULARY = [
+    ("water", r"water", "מים", ()),
+    ("soda", r"(?:unsweetened )?soda(?:/sparkling water)?|sparkling water", "סודה", ("מים מוגזים",)),
+    ("tea", r"(?:unsweetened )?tea", "תה", ()),
+    ("meat", r"meat", "בשר", ()),
+    ("eggs", r"eggs?", "ביצים", ("ביצה",)),
+    ("fish", r"fish", "דגים", ("דג",)),
+    ("white fish", r"white fish", "דג לבן", ()),
+    ("dairy", r"dairy", "מוצרי חלב", ("גבינה", "יוגורט")),
+    ("milk", r"milk", "חלב", ()),
+    ("chicken", r"chicken", "עוף", ()),
+    ("chicken breast", r"chicken breast", "חזה עוף", ()),
+    ("lean beef", r"lean beef|beef fillet", "בקר רזה", ("פילה בקר",)),
+    ("sea bass", r"sea bass", "לברק", ("דג ים",)),
+    ("cod", r"cod", "בקלה", ()),
+    ("tuna", r"tuna(?: in water)?", "טונה במים", ("טונה",)),
+    ("salmon", r"salmon", "סלמון", ()),
+    ("kebab", r"kebab", "קבב", ()),
+    ("shawarma", r"shawarma", "שווארמה", ()),
+    ("fatty cheeses", r"fatty cheeses?", "גבינות שמנות", ()),
+    ("tofu", r"tofu", "טופו", ()),
+    ("seitan", r"seitan", "סייטן", ()),
+    ("cleansing vegetables", r"cleansing (?:vegetables|veggies)", "ירקות מנקים", ()),
+    ("artichoke", r"artichokes?", "ארטישוק", ()),
+    ("asparagus", r"asparagus", "אספרגוס", ()),
+    ("onion", r"onions?", "בצל", ()),
+    ("broccoli", r"broccoli", "ברוקולי", ()),
+    ("okra", r"okra", "במיה", ()),
+    ("carrot", r"carrots?", "גזר", ()),
+    ("cabbage", r"cabbage", "כרוב", ()),
+    ("cauliflower", r"cauliflower", "כרובית", ()),
+    ("leeks", r"leeks?", "כרישה", ()),
+    ("palm hearts", r"palm hearts", "לבבות דקל", ()),
+    ("tomato", r"tomato(?:es)?", "עגבנייה", ("עגבניות",)),
+    ("green beans", r"green beans", "שעועית ירוקה", ()),
+    ("cucumber", r"cucumbers?", "מלפפון", ()),
+    ("mushrooms", r"mushrooms?", "פטריות", ()),
+    ("peppers", r"peppers?", "פלפל", ()),
+    ("radish", r"radish(?:es)?", "צנונית", ()),
+    ("kohlrabi", r"kohlrabi", "קולרבי", ()),
+    ("zucchini", r"zucchini", "קישוא", ()),
+    ("lettuce", r"lettuce", "חסה", ()),
+    ("spinach", r"spinach", "תרד", ()),
+    ("beet", r"beets?", "סלק", ()),
+    ("sweet potato", r"sweet potato(?:es)?", "בטטה", ()),
+    ("potato", r"potato(?:es)?", "תפוח אדמה", ("תפו״א", "תפודים")),
+    ("chickpeas", r"chickpeas", "חומוס", ("גרגירי חומוס",)),
+    ("beans", r"beans", "שעועית", ()),
+    ("lentils", r"lentils", "עדשים", ()),
+    ("peas", r"peas", "אפונה", ()),
+    ("legumes", r"legumes", "קטניות", ()),
+    ("quinoa", r"quinoa", "קינואה", ()),
+    ("buckwheat", r"buckwheat", "כוסמת", ()),
+    ("oats", r"(?:thick )?oats", "שיבולת שועל", ("קוואקר",)),
+    ("fruit", r"fruits?", "פירות", ("פרי",)),
+    ("berries", r"berries", "פירות יער", ()),
+    ("dried fruits", r"dried fruits?", "פירות יבשים", ()),
+    ("dates", r"dates", "תמרים", ()),
+    ("juice", r"juice", "מיץ", ()),
+    ("sugar", r"sugar", "סוכר", ()),
+    ("honey", r"honey", "דבש", ()),
+    ("silan", r"silan", "סילאן", ()),
+    ("maple", r"maple", "מייפל", ()),
+    ("agave", r"agave", "סירופ אגבה", ()),
+    ("chocolate", r"chocolate", "שוקולד", ()),
+    ("energy bars", r"energy bars?", "חטיפי אנרגיה", ()),
+    ("halva", r"halva", "חלבה", ()),
+    ("instant pudding", r"instant pudding", "פודינג אינסטנט", ()),
+    ("flour", r"flours?", "קמח", ("לחם", "פסטה")),
+    ("white flour", r"white flour", "קמח לבן", ()),
+    ("whole flour products", r"whole flour products", "מוצרי קמח מלא", ()),
+    ("couscous", r"couscous", "קוסקוס", ()),
+    ("noodles", r"noodles", "אטריות", ()),
+    ("rice cakes", r"rice cakes", "פריכיות אורז", ()),
+    ("rice", r"rice", "אורז", ()),
+    ("corn", r"corn", "תירס", ()),
+    ("fried foods", r"fried foods?", "מטוגנים", ()),
+    ("concentrated fats", r"concentrated fats?", "שומנים מרוכזים", ()),
+    ("tahini", r"tahini", "טחינה", ()),
+    ("tahini bread", r"tahini bread", "לחם טחינה", ()),
+    ("butter", r"butter", "חמאה", ()),
+    ("oil", r"oils?", "שמן", ("שמן זית",)),
+    ("olives", r"olives", "זיתים", ()),
+    ("avocado", r"avocado", "אבוקדו", ()),
+    ("nut butters", r"nut butters?", "חמאת אגוזים", ("חמאת בוטנים",)),
+    ("nuts", r"nuts", "אגוזים", ("שקדים",)),
+    ("peanuts", r"peanuts", "בוטנים", ()),
+    ("leptin shake", r"leptin shake", "שייק לפטין", ()),
+    ("wine", r"(?:dry |red )*wine", "יין", ()),
+    ("beer", r"beer", "בירה", ()),
+]
+ 
+# Workbook groups and the vocabulary foods each stands for; "cleansing
+# vegetables" is built from the workbook's vegetable lists and CLEANING_VEGGIES
+FOOD_GROUPS = {"legumes": ("lentils", "chickpeas", "beans", "peas")}
+ 
+STATUS_ORDER = {"allowed": 0, "limited": 1, "forbidden": 2}
+ 
+Food = namedtuple("Food", "id name aliases cleansing")
+Stage = namedtuple("Stage", "first last track statuses eats_as_usual")
+ 
+_FORBIDDEN_RE = re.compile(r"\b(?:forbidden|holiday from|avoidance of|avoid(?! \w+ing\b))\b")
+_ALLOWED_RE = re.compile(r"\b(?:freely|unrestricted|unlimited|no \w+ restrictions?)\b")
+_LIMITED_RE = re.compile(r"\b(?:limit\w*|max\w*|portions?|tbsp|glass|once a day|\d+ fruit)\b")
+_NO_RE = re.compile(r"^no\b")
+_CLAUSE_RE = re.compile(r"(?<=[.;])\s+")
+_WEEKS_RE = re.compile(r"(\d+)(?:\s*-\s*(\d+)|(\+))?")
+_NIQQUD_RE = re.compile("[֑-ׇ]")
+_FINALS = str.maketrans("ךםןףץ", "כמנפצ", "׳״'\"`")
+ 
+ 
+def normalize(text):
+    """Search form of a name: no niqqud, quotes or final letters, single spaces"""
+    text = _NIQQUD_RE.sub("", text).translate(_FINALS).lower()
+    return " ".join(text.split())
+ 
+ 
+def _vocabulary_re():
+    # Longest patterns first, so a regex alternation prefers "sweet potato" over "potato"
+    entries = sorted(FOOD_VOCABULARY, key=lambda entry: -len(entry[1]))
+    pattern = "|".join(f"(?P<f{index}>\\b(?:{entry[1]})\\b)" for index, entry in enumerate(entries))
+    return re.compile(pattern, re.IGNORECASE), [entry[0] for entry in entries]
+ 
+ 
+def _foods_in(text, vocabulary):
+    pattern, ids = vocabulary
+    return [ids[int(match.lastgroup[1:])] for match in pattern.finditer(text)]
+ 
+ 
+def _split_top_level(text):
+    """Comma-separated items with their parenthesised parts split off: [(item, [sub, ...])]"""
+    items, depth, current = [], 0, ""
+    for char in text:
+        depth += (char == "(") - (char == ")")
+        if char == "," and depth == 0:
+            items.append(current)
+            current = ""
+        else:
+            current += char
+    items.append(current)
+    return [(re.sub(r"\([^)]*\)", " ", item), re.findall(r"\(([^)]*)\)", item)) for item in items]
+ 
+ 
+def _own_status(text):
+    low = text.lower().strip()
+    if _ALLOWED_RE.search(low):
+        return "allowed"
+    if _FORBIDDEN_RE.search(low) or _NO_RE.search(low):
+        return "forbidden"
+    if _LIMITED_RE.search(low):
+        return "limited"
+    return None
+ 
+ 
+def _clause_statuses(clause, vocabulary):
+    """[(food id, status, label)] of one clause of a workbook cell"""
+    label, colon, body = clause.partition(":")
+    if not colon or len(label) > 60:
+        label, body = "", clause
+    if _FORBIDDEN_RE.search(clause.lower()):
+        return [(food, "forbidden", label) for food in _foods_in(clause, vocabulary)]
+ 
+    found = []
+    base = _own_status(label) or "allowed"
+    for item, subs in _split_top_level(body):
+        status = _own_status(item) or base
+        found += [(food, status, label) for food in _foods_in(item, vocabulary)]
+        for sub in subs:
+            sub_status = _own_status(sub) or status
+            found += [(food, sub_status, label) for food in _foods_in(sub, vocabulary)]
+    return found
+ 
+ 
+def _clauses(cell):
+    text = str(cell or "").replace("$", "").replace("\\", "")
+    return [clause.strip() for clause in _CLAUSE_RE.split(text) if clause.strip()]
+ 
+ 
+def _stage_range(name):
+    match = _WEEKS_RE.search(name or "")
+    first = int(match.group(1))
+    if match.group(3):
+        return first, None
+    return first, int(match.group(2) or first)
+ 
+ 
+def _stage_track(name):
+    match = re.search(r"(\w+) Track", name or "")
+    return match.group(1).lower() if match else None
+ 
+ 
+def _vocabulary_ids(names):
+    """Vocabulary food ids of Hebrew names or aliases; every name must be in FOOD_VOCABULARY"""
+    ids = {normalize(name): food for food, _, hebrew, aliases in FOOD_VOCABULARY for name in (hebrew, *aliases)}
+    missing = [name for name in names if normalize(name) not in ids]
+    if missing:
+        raise ValueError(f"Not in FOOD_VOCABULARY: {', '.join(missing)}")
+    return [ids[normalize(name)] for name in names]
+ 
+ 
+class FoodCatalog:
+    """Foods with per-stage statuses and name indexes, compiled from the workbook rows"""
+ 
+    PREFIX_RESULTS = 8
+    MIN_SHARED_TRIGRAMS = 2
+ 
+    def __init__(self, rows):
+        vocabulary = _vocabulary_re()
+        names = {food: (name, aliases) for food, _, name, aliases in FOOD_VOCABULARY}
+        cleansing = {food: True for food in _vocabulary_ids(CLEANING_VEGGIES)}
+        # The cleanse card's lists: status() applies them in the cleanse weeks
+        # only, so the stages keep what the workbook itself says
+        self.cleanse_rules = {
+            **{food: "allowed" for food in _vocabulary_ids(CLEANSE_ALLOWED)},
+            **{food: "forbidden" for food in _vocabulary_ids(CLEANSE_FORBIDDEN)},
+        }
+        parsed = []
+        for row in rows:
+            permitted = {}
+            other = {}
+            for column, target in (("Permitted Foods (Proteins, Veggies, Fats)", permitted),
+                                   ("Dietary Instructions and Restrictions", other),
+                                   ("General Non-Weekly Guidelines", other)):
+                for clause in _clauses(row.get(column)):
+                    for food, status, label in _clause_statuses(clause, vocabulary):
+                        if STATUS_ORDER[status] >= STATUS_ORDER[target.get(food, "allowed")]:
+                            target[food] = status
+                        if "veg" in label.lower():
+                            cleansing.setdefault(food, "non-cleansing" not in label.lower())
+            instructions = str(row.get("Dietary Instructions and Restrictions") or "").lower()
+            # The permitted-foods column has the last word over prose elsewhere in the row
+            parsed.append((row, {**other, **permitted}, "as usual" in instructions or "eat freely" in instructions))
+ 
+        groups = {"cleansing vegetables": [food for food, is_cleansing in cleansing.items() if is_cleansing],
+                  **FOOD_GROUPS}
+        self.stages = []
+        inherited, inherited_as_usual = {}, False
+        for row, own, eats_as_usual in parsed:
+            # A group speaks for each of its foods the row doesn't name itself
+            for group, members in groups.items():
+                if group in own:
+                    for food in members:
+                        own.setdefault(food, own[group])
+            first, last = _stage_range(row["Week or Phase"])
+            track = _stage_track(row["Track Name"])
+            if inherited_as_usual and not eats_as_usual:
+                # What the free-eating weeks allowed is no guide once restrictions start
+                inherited = {food: status for food, status in inherited.items() if status != "allowed"}
+            statuses = {**inherited, **own}
+            self.stages.append(Stage(first, last, track, statuses, eats_as_usual))
+            if track is None:
+                inherited, inherited_as_usual = statuses, eats_as_usual
+ 
+        self.foods = {}
+        for food in {food for stage in self.stages for food in stage.statuses} | set(self.cleanse_rules):
+            name, aliases = names[food]
+            self.foods[food] = Food(food, name, aliases, cleansing.get(food))
+        self._stage_cache = {}
+        self._build_indexes()
+ 
+    def _build_indexes(self):
+        ranked = {}
+        self._trigrams = {}
+        for food in self.foods.values():
+            for name in (food.name, *food.aliases, food.id):
+                key = normalize(name)
+                words = key.split()
+                for start, word in enumerate(words):
+                    rest = " ".join(words[start:])
+                    for end in range(1, len(rest) + 1):
+                        rank = (0 if start == 0 else 1, len(key))
+                        bucket = ranked.setdefault(rest[:end], {})
+                        bucket[food.id] = min(bucket.get(food.id, rank), rank)
+                padded = f"  {key} "
+                for index in range(len(padded) - 2):
+                    self._trigrams.setdefault(padded[index:index + 3], set()).add(food.id)
+        self._prefixes = {
+            prefix: tuple(sorted(bucket, key=bucket.get)[:self.PREFIX_RESULTS])
+            for prefix, bucket in ranked.items()
+        }
+ 
+    def search(self, query, limit=5):
+        """Foods whose names match query: name and word prefixes first, then shared trigrams"""
+        key = normalize(query)
+        if not key:
+            return []
+        hits = self._prefixes.get(key)
+        if hits:
+            return [self.foods[food] for food in hits[:limit]]
+ 
+        # Only trigrams inside the query count: a shared word ending ("נה ") is no match
+        trigrams = [key[index:index + 3] for index in range(len(key) - 2)]
+        counts = Counter(food for trigram in trigrams for food in self._trigrams.get(trigram, ()))
+        threshold = max(self.MIN_SHARED_TRIGRAMS, (len(trigrams) + 1) // 2)
+        return [self.foods[food] for food, count in counts.most_common(limit) if count >= threshold]
+ 
+    def stage(self, week, track=None):
+        """The workbook row for a program week and week-9+ track
+ 
+        Weeks between rows (week 8) follow the row before them; a track
+        without a row of its own (the cleanse track) keeps the cleaning rules.
+        """
+        cached = self._stage_cache.get((week, track))
+        if cached is None:
+            candidates = [stage for stage in self.stages
+                          if stage.first <= week and stage.track in (None, track)]
+            tracked = [stage for stage in candidates if stage.track == track and track]
+            cached = self._stage_cache[(week, track)] = (tracked or candidates or self.stages[:1])[-1]
+        return cached
+ 
+    def status(self, food, week, track=None):
+        """"allowed", "limited", "forbidden" or None when the workbook doesn't say"""
+        if food.id in self.cleanse_rules and get_phase(week)[0] == "cleanse":
+            return self.cleanse_rules[food.id]
+        stage = self.stage(week, track)
+        return stage.statuses.get(food.id, "allowed" if stage.eats_as_usual else None)
+ 
+ 
+@st.cache_resource(max_entries=1)
+def _compile_catalog(path, mtime):
+    return FoodCatalog(read_workbook_rows(path))
+ 
+ 
+def get_food_catalog():
+    """The compiled catalog, rebuilt when the workbook changes on disk; None without one"""
+    try:
+        mtime = os.path.getmtime(FOOD_DATABASE)
+    except OSError:
+        return None
+    return _compile_catalog(FOOD_DATABASE, mtime)
@@ -0,0 +1,58 @@
+"""
+Compact, versioned encoding of the gist month files
+ 
+Format 2 stores a month as {"v": 2, "z": <base64 of zlib>}, the payload
+being {"fields": [...], "days": {date: [value, ...]}}: one positional array
+per day in "fields" order, with a trailing dict for any fields outside it.
+The field list travels with the payload, so files stay readable after
+DEFAULT_LOG gains or reorders fields. Files without "v" are the legacy
+{date: log} layout and are read as they are.
+"""
+ 
+import base64
+import json
+import zlib
+ 
+from leptin.logs import DEFAULT_LOG
+ 
+ 
+FORMAT_VERSION = 2
+# Past 6 zlib spends several times longer for a percent or two of size
+ZLIB_LEVEL = 6
+_FIELDS = list(DEFAULT_LOG)
+ 
+ 
+def encode_month(logs):
+    """Format-2 file content for {date: log}"""
+    days = {}
+    for date, log in logs.items():
+        row = [log.get(field, default) for field, default in DEFAULT_LOG.items()]
+        extra = {field: value for field, value in log.items() if field not in DEFAULT_LOG}
+        if extra:
+            row.append(extra)
+        days[date] = row
+    payload = json.dumps({"fields": _FIELDS, "days": days}, ensure_ascii=False, separators=(",", ":"))
+    packed = base64.b64encode(zlib.compress(payload.encode("utf-8"), ZLIB_LEVEL)).decode("ascii")
+    return json.dumps({"v": FORMAT_VERSION, "z": packed}, separators=(",", ":"))
+ 
+ 
+def is_legacy_month(content):
+    return "v" not in content
+ 
+ 
+def decode_month(content):
+    """{date: log} from a parsed month file of any format"""
+    if is_legacy_month(content):
+        return content
+    if content["v"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported month file format: {content['v']}")
+ 
+    payload = json.loads(zlib.decompress(base64.b64decode(content["z"])))
+    fields = payload["fields"]
+    logs = {}
+    for date, row in payload["days"].items():
+        log = dict(zip(fields, row))
+        if len(row) > len(fields):
+            log.update(row[-1])
+        logs[date] = log
+    return logs
@@ -0,0 +1,82 @@
+"""
+Client-side dashboard component for today's tracking
+"""
+ 
+import streamlit as st
+from datetime import datetime, timedelta
+import functools
+import os
+ 
+from leptin.logs import DEFAULT_LOG
+from leptin.storage import save_data
+from leptin.scoring import GOOD_DAY_SCORE, get_streak_index
+from leptin.ui import STATIC_DIR
+ 
+ 
+# Today's rings, counters and toggles run in the browser as a bidirectional
+# component (static/dashboard.js), which scores with the same rules as
+# calculate_score. Edits come back in batches: each batch is one "sync"
+# trigger, applied by a callback before the dashboard fragment reruns.
+ 
+DASHBOARD_FIELDS = ("water_liters", "water_before_meals", "veggies_50_percent",
+                    "protein_every_meal", "eating_window_hours", "fats_count")
+# (low, high, step) of the numeric fields; None means unbounded
+DASHBOARD_LIMITS = {
+    "water_liters": (0, 6, 0.5),
+    "water_before_meals": (0, 6, 1),
+    "eating_window_hours": (0, 16, 1),
+    "fats_count": (0, None, 1),
+}
+DASHBOARD_SYNC_IDLE_MS = 1500
+ 
+ 
+@st.cache_resource
+def get_dashboard_component():
+    """Register the dashboard component once per process"""
+    with open(os.path.join(STATIC_DIR, "dashboard.js"), encoding="utf-8") as f:
+        js = f.read()
+    return st.components.v2.component("today_dashboard", js=js, isolate_styles=False)
+ 
+ 
+def _apply_dashboard_sync(data, today, key):
+    sync = st.session_state[key].get("sync")
+    if not sync or sync.get("date") != today:
+        return
+ 
+    log = data["daily_logs"][today]
+    for field, value in sync.get("changes", {}).items():
+        if field not in DASHBOARD_FIELDS:
+            continue
+        value = type(DEFAULT_LOG[field])(value)
+        if field in DASHBOARD_LIMITS:
+            low, high, _ = DASHBOARD_LIMITS[field]
+            value = max(low, value if high is None else min(high, value))
+        log[field] = value
+ 
+    st.session_state[f"{key}_seq"] = sync.get("seq", 0)
+    save_data(data)
+ 
+ 
+@st.fragment
+def dashboard_zone(data, today, program_day, week):
+    key = f"dashboard_{today}"
+    log = data["daily_logs"][today]
+    yesterday = (datetime.strptime(today, "%Y-%m-%d") - timedelta(days=1)).strftime("%Y-%m-%d")
+ 
+    get_dashboard_component()(
+        key=key,
+        data={
+            "date": today,
+            "seq": st.session_state.get(f"{key}_seq", 0),
+            "log": {field: log.get(field, default) for field, default in DEFAULT_LOG.items()},
+            "program_day": program_day,
+            "days": 91,
+            "week": week,
+            "weeks": 13,
+            "streak_before": get_streak_index(data).current(yesterday, data.get("archive")),
+            "good_day_score": GOOD_DAY_SCORE,
+            "limits": DASHBOARD_LIMITS,
+            "sync_idle_ms": DASHBOARD_SYNC_IDLE_MS,
+        },
+        on_sync_change=functools.partial(_apply_dashboard_sync, data, today, key),
+    )
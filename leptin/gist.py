@@ -0,0 +1,303 @@
+"""
+GitHub Gist storage: one settings file plus one compact file per month of logs
+"""
+ 
+import streamlit as st
+import json
+import requests
+from requests.adapters import HTTPAdapter
+import os
+import threading
+ 
+from leptin.logs import DATA_FILE, DailyLogs, LOGS_FILE_PREFIX, get_default_data, settings_document, tracked_logs
+from leptin.jsonstream import RAW_CHUNK_SIZE, iter_json_members
+from leptin.codec import decode_month, encode_month, is_legacy_month
+ 
+ 
+def _month_file(month):
+    return f"{LOGS_FILE_PREFIX}{month}.json"
+ 
+ 
+def gist_files_from_data(data, full=False):
+    """{filename: content} for the settings file plus every month with unsaved days"""
+    logs = tracked_logs(data)
+    # Under the lock, so another session's edit can't land between taking the
+    # dirty days and serializing them
+    with logs.lock:
+        dirty = logs.take_dirty()
+        try:
+            months = logs.months() if full else {date[:7] for date in dirty}
+            files = {DATA_FILE: json.dumps(settings_document(data), ensure_ascii=False, separators=(",", ":"))}
+            for month in sorted(months):
+                files[_month_file(month)] = encode_month(logs.month(month))
+        except Exception:
+            logs.dirty.update(dirty)
+            raise
+    return files
+ 
+ 
+def _gist_file_members(gist_file, open_raw=None, descend=()):
+    """(key, value) members of a gist JSON file; see iter_json_members for `descend`
+ 
+    The Gist API cuts inline content at about 1 MB and flags the file as
+    truncated - those files are streamed from raw_url instead.
+    """
+    if gist_file.get("truncated") and open_raw:
+        yield from iter_json_members(open_raw(gist_file["raw_url"]), descend)
+        return
+ 
+    for key, value in json.loads(gist_file["content"]).items():
+        if key in descend and isinstance(value, dict):
+            for sub_key, item in value.items():
+                yield (key, sub_key), item
+        else:
+            yield key, value
+ 
+ 
+def _month_files(files, open_raw=None):
+    """(month, parsed content) of every month file, oldest first"""
+    for name in sorted(files):
+        if name.startswith(LOGS_FILE_PREFIX):
+            yield name[len(LOGS_FILE_PREFIX):-len(".json")], dict(_gist_file_members(files[name], open_raw))
+ 
+ 
+def _data_from_gist_files(files, open_raw=None):
+    """Merge the settings file, legacy inline logs and the month files into one document
+ 
+    Month files up to the archived date (see leptin.archive) are skipped.
+    """
+    if DATA_FILE not in files:
+        return get_default_data()
+ 
+    data = {}
+    legacy_logs = {}
+    for key, value in _gist_file_members(files[DATA_FILE], open_raw, descend=("daily_logs",)):
+        if isinstance(key, tuple):
+            legacy_logs[key[1]] = value
+        else:
+            data[key] = value
+    data.pop("daily_logs", None)
+ 
+    archived = (data.get("archive") or {}).get("through") or ""
+    month_logs = {}
+    legacy_months = {}
+    for month, content in _month_files(files, open_raw):
+        if month <= archived[:7]:
+            continue
+        if is_legacy_month(content):
+            legacy_months.update(content)
+        month_logs.update(decode_month(content))
+ 
+    logs = DailyLogs({**legacy_logs, **month_logs})
+    # Days still stored inline or in legacy month files are rewritten in the
+    # compact format by the next save
+    logs.dirty.update(day for day in legacy_logs if day not in month_logs)
+    logs.dirty.update(legacy_months)
+    data["daily_logs"] = logs
+    return data
+ 
+ 
+GIST_API = "https://api.github.com/gists"
+GIST_CACHE_DIR = ".leptin_cache"
+ 
+ 
+class GistClient:
+    """Keep-alive connection pool to the Gist API with credentials resolved once"""
+ 
+    def __init__(self, token, gist_id, cache_dir=GIST_CACHE_DIR):
+        self.token = token
+        self.gist_id = gist_id
+        self.cache_dir = cache_dir
+        self._cache_lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github.v3+json"
+        })
+ 
+    def _cache_path(self):
+        return os.path.join(self.cache_dir, f"gist_{self.gist_id}.json")
+ 
+    def _read_cache(self):
+        try:
+            with open(self._cache_path(), encoding="utf-8") as f:
+                cached = json.load(f)
+            return cached["etag"], cached["files"]
+        except (OSError, ValueError, KeyError):
+            return None, None
+ 
+    def cached_files(self):
+        """Files of the last response kept on disk, or None"""
+        return self._read_cache()[1]
+ 
+    def _write_cache(self, etag, files):
+        if not etag:
+            return
+        with self._cache_lock:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = self._cache_path() + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"etag": etag, "files": files}, f, ensure_ascii=False)
+                os.replace(tmp_path, self._cache_path())
+            except OSError:
+                pass
+ 
+    def fetch(self):
+        """GET the gist; returns its files or None
+ 
+        The last response is kept on disk with its ETag, so an unchanged gist
+        costs a 304 with no body, which GitHub doesn't count against the
+        rate limit.
+        """
+        etag, cached_files = self._read_cache()
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self.session.get(f"{GIST_API}/{self.gist_id}", headers=headers, timeout=10)
+        if response.status_code == 304 and cached_files is not None:
+            return cached_files
+        if response.status_code == 200:
+            files = response.json()["files"]
+            self._write_cache(response.headers.get("ETag"), files)
+            return files
+        return None
+ 
+    def is_current(self):
+        """Whether the response kept on disk is still the gist's latest version
+ 
+        A conditional GET: an unchanged gist answers 304 with no body, and a
+        changed one refreshes the cache, so the reload that follows is a 304.
+        """
+        etag, _ = self._read_cache()
+        if not etag:
+            return False
+        response = self.session.get(f"{GIST_API}/{self.gist_id}", headers={"If-None-Match": etag}, timeout=10)
+        if response.status_code == 200:
+            self._write_cache(response.headers.get("ETag"), response.json()["files"])
+        return response.status_code == 304
+ 
+    def stream_raw(self, url, chunk_size=RAW_CHUNK_SIZE):
+        """Yield a file's raw body in chunks"""
+        with self.session.get(url, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size)
+ 
+    def patch_files(self, files, gist_id=None):
+        """PATCH the given {filename: content} files into the gist (by default the configured one)"""
+        gist_id = gist_id or self.gist_id
+        try:
+            response = self.session.patch(
+                f"{GIST_API}/{gist_id}",
+                json={
+                    "description": "Leptin Method Tracker Data",
+                    "files": {name: {"content": content} for name, content in files.items()}
+                },
+                timeout=10
+            )
+            if response.status_code != 200:
+                return False
+            # The PATCH response is the updated gist - cache it so the next load is a 304
+            if gist_id == self.gist_id:
+                self._write_cache(response.headers.get("ETag"), response.json()["files"])
+            return True
+        except Exception:
+            return False
+ 
+    def create(self, files):
+        """POST a new private gist; returns its id or None"""
+        response = self.session.post(
+            GIST_API,
+            json={
+                "description": "Leptin Method Tracker Data",
+                "public": False,
+                "files": {name: {"content": content} for name, content in files.items()}
+            },
+            timeout=10
+        )
+        if response.status_code == 201:
+            self.gist_id = response.json()["id"]
+            return self.gist_id
+        return None
+ 
+ 
+@st.cache_resource
+def get_gist_client():
+    """Process-wide gist client shared by all sessions"""
+    return GistClient(st.secrets.get("GITHUB_TOKEN", ""), st.secrets.get("GIST_ID", ""))
+ 
+ 
+def get_gist_files(unsent=None):
+    """The gist's files, or None
+ 
+    unsent is {filename: content} saved locally but not yet accepted by the
+    gist; it is laid over the fetched files. When the gist can't be reached
+    the last response kept on disk stands in for it.
+    """
+    client = get_gist_client()
+ 
+    if not client.token or not client.gist_id:
+        return None
+ 
+    try:
+        files = client.fetch()
+    except requests.RequestException:
+        files = None
+    if files is None:
+        files = client.cached_files()
+    if unsent:
+        files = {**(files or {}), **{name: {"content": content} for name, content in unsent.items()}}
+    return files
+ 
+ 
+def get_gist_data(unsent=None):
+    """Load data from GitHub Gist"""
+    try:
+        files = get_gist_files(unsent)
+        if files is not None:
+            return _data_from_gist_files(files, get_gist_client().stream_raw)
+ 
+        return get_default_data()
+    except Exception:
+        return get_default_data()
+ 
+ 
+def get_archived_gist_logs(through, unsent=None):
+    """{date: log} of the month files up to the archived date through"""
+    files = get_gist_files(unsent) or {}
+    logs = {}
+    for month, content in _month_files(files, get_gist_client().stream_raw):
+        if month <= through[:7]:
+            logs.update(decode_month(content))
+    return logs
+ 
+ 
+def save_gist_data(data):
+    """Save data to GitHub Gist"""
+    client = get_gist_client()
+ 
+    if not client.token:
+        return False
+ 
+    logs = tracked_logs(data)
+    unsaved = set()
+    try:
+        with logs.lock:
+            unsaved = set(logs.dirty)
+            files = gist_files_from_data(data, full=not client.gist_id)
+ 
+        if client.gist_id:
+            saved = client.patch_files(files)
+        else:
+            new_gist_id = client.create(files)
+            if new_gist_id:
+                st.info(f"GIST_ID חדש: {new_gist_id}")
+            saved = new_gist_id is not None
+    except Exception:
+        saved = False
+ 
+    if not saved:
+        # The next save sends these days again
+        with logs.lock:
+            logs.dirty.update(unsaved)
+    return saved
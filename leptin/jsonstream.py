@@ -0,0 +1,95 @@
+"""
+Incremental JSON parsing for large gist files
+"""
+ 
+import json
+import codecs
+ 
+ 
+RAW_CHUNK_SIZE = 64 * 1024
+_JSON_DECODER = json.JSONDecoder()
+# Characters that can only follow a value when it is a number cut short
+_NUMBER_CONTINUES = frozenset(".eE+-0123456789")
+ 
+ 
+class _JSONStream:
+    """Buffered reader over a byte-chunk iterator, holding at most ~one chunk"""
+ 
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+ 
+    def _more(self):
+        if self.eof:
+            raise ValueError("Unexpected end of JSON stream")
+        chunk = next(self._chunks, None)
+        self.eof = chunk is None
+        self.buf = self.buf[self.pos:] + self._utf8.decode(chunk or b"", final=self.eof)
+        self.pos = 0
+ 
+    def peek(self):
+        """Next non-whitespace character, without consuming it"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            self._more()
+ 
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found!r}")
+        self.pos += 1
+ 
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self.buf, self.pos)
+            except ValueError:
+                self._more()
+                continue
+            if not self.eof and (end == len(self.buf) or self.buf[end] in _NUMBER_CONTINUES):
+                # A number cut by the chunk boundary ("-0." or "1e") decodes as
+                # its valid prefix; it may continue in the next chunk
+                self._more()
+                continue
+            self.pos = end
+            return value
+ 
+    def object_keys(self):
+        """Yield the keys of an object; the caller reads each value before resuming"""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' in JSON stream, found {separator!r}")
+ 
+ 
+def iter_json_members(chunks, descend=()):
+    """Incrementally parse a JSON object from byte chunks, yielding (key, value)
+ 
+    Members named in `descend` whose value is an object are not built in
+    memory - their entries are yielded one by one as ((key, sub_key), value).
+    """
+    stream = _JSONStream(chunks)
+    for key in stream.object_keys():
+        if key in descend and stream.peek() == "{":
+            for sub_key in stream.object_keys():
+                yield (key, sub_key), stream.value()
+        else:
+            yield key, stream.value()
@@ -0,0 +1,292 @@
+"""
+Daily logs with change tracking, and the default document
+"""
+ 
+from datetime import datetime
+from collections.abc import MutableMapping
+import bisect
+import threading
+import time
+ 
+ 
+DATA_FILE = "leptin_data.json"
+LOGS_FILE_PREFIX = "leptin_logs_"
+ 
+ 
+DEFAULT_LOG = {
+    "water_liters": 0.0,
+    "water_before_meals": 0,
+    "veggies_50_percent": False,
+    "protein_every_meal": False,
+    "eating_window_hours": 0,
+    "fats_count": 0,
+    "treat_day": False,
+    "forbidden_food": False,
+    "notes": "",
+    "completed": False
+}
+ 
+ 
+def day_ordinal(date):
+    """ "%Y-%m-%d" -> proleptic Gregorian ordinal (program day = ordinal - start ordinal + 1)"""
+    return datetime.fromisoformat(date).toordinal()
+ 
+ 
+def ordinal_date(day):
+    return datetime.fromordinal(day).strftime("%Y-%m-%d")
+ 
+ 
+class DailyLog:
+    """One day's log as a slotted record that reads and writes like its JSON dict
+ 
+    Every field write marks the day as unsaved in the owning DailyLogs
+    and is recorded in its event journal.
+    Fields outside DEFAULT_LOG are kept in a side dict so nothing is lost.
+    """
+ 
+    __slots__ = tuple(DEFAULT_LOG) + ("_owner", "_day", "_extra")
+ 
+    def __init__(self, owner, day, values=None):
+        for field, default in DEFAULT_LOG.items():
+            setattr(self, field, default)
+        self._extra = None
+        for field, value in (values or {}).items():
+            self._set(field, value)
+        self._owner = owner
+        self._day = day
+ 
+    def _set(self, field, value):
+        if field in DEFAULT_LOG:
+            setattr(self, field, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[field] = value
+ 
+    def __getitem__(self, field):
+        if field in DEFAULT_LOG:
+            return getattr(self, field)
+        if self._extra and field in self._extra:
+            return self._extra[field]
+        raise KeyError(field)
+ 
+    def __setitem__(self, field, value):
+        with self._owner.lock:
+            self._owner.before_change(self._day)
+            self._set(field, value)
+            self._owner.record(self._day, field, "set", value)
+            self._owner.mark_dirty(ordinal_date(self._day))
+ 
+    def __contains__(self, field):
+        return field in DEFAULT_LOG or bool(self._extra and field in self._extra)
+ 
+    def get(self, field, default=None):
+        try:
+            return self[field]
+        except KeyError:
+            return default
+ 
+    def keys(self):
+        return list(DEFAULT_LOG) + list(self._extra or ())
+ 
+    def __iter__(self):
+        return iter(self.keys())
+ 
+    def __len__(self):
+        return len(DEFAULT_LOG) + len(self._extra or ())
+ 
+    def items(self):
+        return [(field, self[field]) for field in self.keys()]
+ 
+    def to_dict(self):
+        """The JSON-schema dict for the storage boundary"""
+        return dict(self.items())
+ 
+    def __eq__(self, other):
+        if hasattr(other, "items"):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+ 
+    def __repr__(self):
+        return f"DailyLog({ordinal_date(self._day)}, {self.to_dict()!r})"
+ 
+ 
+class DailyLogs(MutableMapping):
+    """"%Y-%m-%d" -> DailyLog mapping that remembers which days changed since the last save
+ 
+    Days are stored under their date ordinal; string dates only exist at the
+    API edge and in the JSON schema. Changes are also journaled as
+    (date, field, op, value, timestamp) events until a backend takes them:
+    "set" writes one field, "put" replaces a whole day (field is None) and
+    "del" removes it. Values are absolute, so replaying an event twice is harmless.
+    """
+ 
+    def __init__(self, logs=None, dirty=False):
+        self._days = {}
+        self._sorted = []
+        self.dirty = set()
+        self.events = []
+        self.indexes = {}
+        # Serialises changes and index builds: every session shares one
+        # DailyLogs, and indexes may also be built on a prefetch thread
+        self.lock = threading.RLock()
+        self._listeners = []
+        self._before_listeners = []
+        for date, log in (logs or {}).items():
+            self._store(date, log)
+        if dirty:
+            self.dirty.update(self)
+ 
+    def __getitem__(self, date):
+        return self._days[day_ordinal(date)]
+ 
+    def __setitem__(self, date, log):
+        day = day_ordinal(date)
+        with self.lock:
+            if day in self._days:
+                self.before_change(day)
+            self._store(date, log)
+            self.record(day, None, "put", self._days[day].to_dict())
+            self.mark_dirty(date)
+ 
+    def __delitem__(self, date):
+        day = day_ordinal(date)
+        with self.lock:
+            self.before_change(day)
+            del self._days[day]
+            del self._sorted[bisect.bisect_left(self._sorted, day)]
+            self.dirty.discard(date)
+            self.record(day, None, "del", None)
+ 
+    def __contains__(self, date):
+        try:
+            return day_ordinal(date) in self._days
+        except (TypeError, ValueError):
+            return False
+ 
+    def __iter__(self):
+        return (ordinal_date(day) for day in self._days)
+ 
+    def __len__(self):
+        return len(self._days)
+ 
+    def __repr__(self):
+        return f"DailyLogs({dict(self.items())!r})"
+ 
+    def _store(self, date, log):
+        day = day_ordinal(date)
+        if day not in self._days:
+            # New days are almost always the latest one, making this an append
+            bisect.insort(self._sorted, day)
+        self._days[day] = DailyLog(self, day, log)
+ 
+    def _drop(self, day):
+        if self._days.pop(day, None) is not None:
+            del self._sorted[bisect.bisect_left(self._sorted, day)]
+ 
+    def mark_dirty(self, date):
+        self.dirty.add(date)
+        for listener in self._listeners:
+            listener(date, self[date])
+ 
+    def record(self, day, field, op, value):
+        self.events.append((ordinal_date(day), field, op, value, time.time()))
+ 
+    def before_change(self, day):
+        if self._before_listeners:
+            date = ordinal_date(day)
+            for listener in self._before_listeners:
+                listener(date, self._days[day])
+ 
+    def subscribe(self, listener, before=None):
+        """Call listener(date, log) after every change to a day, and before(date, log) ahead of it"""
+        self._listeners.append(listener)
+        if before:
+            self._before_listeners.append(before)
+ 
+    def unsubscribe(self, listener, before=None):
+        self._listeners.remove(listener)
+        if before:
+            self._before_listeners.remove(before)
+ 
+    def recent(self, limit, offset=0):
+        """[(date, log)] for `limit` days, newest first, skipping the newest `offset`"""
+        end = len(self._sorted) - offset
+        days = self._sorted[max(0, end - limit):max(0, end)]
+        return [(ordinal_date(day), self._days[day]) for day in reversed(days)]
+ 
+    def before(self, date):
+        """Dates earlier than date, oldest first"""
+        end = bisect.bisect_left(self._sorted, day_ordinal(date))
+        return [ordinal_date(day) for day in self._sorted[:end]]
+ 
+    def evict(self, dates):
+        """Drop days that live on in storage only: no journal, listeners or unsaved marks"""
+        with self.lock:
+            for date in dates:
+                self._drop(day_ordinal(date))
+ 
+    def take_dirty(self):
+        """Return the unsaved dates and start tracking afresh"""
+        with self.lock:
+            dirty, self.dirty = self.dirty, set()
+        return dirty
+ 
+    def take_events(self):
+        """Return the journaled events in order and start a new journal"""
+        with self.lock:
+            events, self.events = self.events, []
+        return events
+ 
+    def replay(self, events):
+        """Apply stored events on top of a snapshot, without journaling or marking days unsaved"""
+        for date, field, op, value, _ in events:
+            day = day_ordinal(date)
+            if op == "put":
+                self._store(date, value)
+            elif op == "del":
+                self._drop(day)
+            elif day in self._days:
+                self._days[day]._set(field, value)
+            else:
+                self._store(date, {field: value})
+ 
+    def months(self):
+        return {ordinal_date(day)[:7] for day in self._days}
+ 
+    def month(self, month):
+        """JSON dicts of one "%Y-%m" month, without scanning the rest of the history"""
+        year, number = int(month[:4]), int(month[5:7])
+        first = datetime(year, number, 1).toordinal()
+        following = datetime(year + number // 12, number % 12 + 1, 1).toordinal()
+        return {
+            ordinal_date(day): self._days[day].to_dict()
+            for day in range(first, following) if day in self._days
+        }
+ 
+ 
+def tracked_logs(data):
+    """Make sure data["daily_logs"] tracks changes; untracked logs count as unsaved"""
+    logs = data.get("daily_logs")
+    # Streamlit reloads edited modules, redefining DailyLogs, so a logs
+    # object kept in session_state is recognised by behaviour, not class
+    if not hasattr(logs, "take_dirty"):
+        logs = data["daily_logs"] = DailyLogs(logs, dirty=True)
+    return logs
+ 
+ 
+def settings_document(data):
+    """Everything in the document except the daily logs"""
+    return {key: value for key, value in data.items() if key != "daily_logs"}
+ 
+ 
+def get_default_data():
+    """Return default data structure"""
+    return {
+        "user_settings": {
+            "start_date": None,
+            "track": None,
+            "name": ""
+        },
+        "daily_logs": DailyLogs()
+    }
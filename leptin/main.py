@@ -0,0 +1,125 @@
+"""
+Page entry point: login, load and tab navigation
+"""
+ 
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import threading
+ 
+from leptin.logs import tracked_logs
+from leptin.storage import document_version, get_shared_documents, get_storage, load_document
+from leptin.scoring import get_score, get_streak_index
+from leptin.rollups import get_rollups
+from leptin.catalog import get_food_catalog
+from leptin.rules import get_phase_rules
+from leptin.auth import check_password
+from leptin.ui import inject_stylesheet, render_skeleton
+from leptin.screens import HISTORY_PAGE_SIZE, show_daily_tracking, show_history, show_onboarding, show_settings
+ 
+ 
+def _warm_views(data):
+    get_streak_index(data)
+    get_rollups(data)
+    for date, log in tracked_logs(data).recent(HISTORY_PAGE_SIZE):
+        get_score(date, log)
+    get_food_catalog()
+ 
+ 
+def prefetch_views(data):
+    """Build what the hidden tabs read on a background thread, once per document"""
+    logs = tracked_logs(data)
+    with logs.lock:
+        if "prefetch" in logs.indexes:
+            return
+        thread = logs.indexes["prefetch"] = threading.Thread(
+            target=_warm_views, args=(data,), name="leptin-prefetch", daemon=True
+        )
+    add_script_run_ctx(thread, get_script_run_ctx())
+    thread.start()
+ 
+ 
+def prefetch_data():
+    """Start loading the document on a background thread, once per session
+ 
+    Runs before the login screen renders, so the fetch overlaps with typing
+    the password instead of starting after it.
+    """
+    if "app_data" in st.session_state or "app_data_loader" in st.session_state:
+        return
+ 
+    storage, documents = get_storage(), get_shared_documents()
+    result = {}
+ 
+    def load():
+        result["data"] = documents.get(storage.document_key, storage.load, storage.is_current)
+        # The today screen's phase rules come next; compile them while the password is typed
+        get_phase_rules(1)
+ 
+    thread = threading.Thread(target=load, name="leptin-load", daemon=True)
+    add_script_run_ctx(thread, get_script_run_ctx())
+    thread.start()
+    st.session_state["app_data_loader"] = (thread, result)
+ 
+ 
+def loaded_data():
+    """The session's document, waiting for the prefetch behind a skeleton if needed"""
+    if "app_data" not in st.session_state:
+        prefetch_data()
+        thread, result = st.session_state.pop("app_data_loader")
+        if thread.is_alive():
+            skeleton = st.empty()
+            skeleton.markdown(render_skeleton(), unsafe_allow_html=True)
+            thread.join()
+            skeleton.empty()
+        # A failed prefetch loads again here, where the error surfaces
+        st.session_state["app_data"] = result["data"] if "data" in result else load_document()
+    else:
+        # A stale shared document was loaded again by a newer session; follow it
+        shared = get_shared_documents().shared(get_storage().document_key)
+        if shared is not None and shared is not st.session_state["app_data"]:
+            st.session_state["app_data"] = shared
+    return st.session_state["app_data"]
+ 
+ 
+DOCUMENT_POLL_SECONDS = 10
+ 
+ 
+@st.fragment(run_every=DOCUMENT_POLL_SECONDS)
+def watch_document():
+    """Rerun the page once another session has saved the shared document"""
+    if document_version() != st.session_state.get("document_version"):
+        st.rerun()
+ 
+ 
+def main():
+    """Main app entry point"""
+    inject_stylesheet()
+    prefetch_data()
+ 
+    if not check_password():
+        return
+ 
+    data = loaded_data()
+    st.session_state["document_version"] = document_version()
+ 
+    if not data["user_settings"].get("start_date"):
+        show_onboarding(data)
+        return
+ 
+    # Navigation - tracked tabs, so only the selected view executes
+    tabs = st.tabs(["📊 היום", "📅 היסטוריה", "⚙️ הגדרות"], key="nav", on_change="rerun")
+ 
+    if tabs[0].open:
+        with tabs[0]:
+            show_daily_tracking(data)
+ 
+    if tabs[1].open:
+        with tabs[1]:
+            show_history(data)
+ 
+    if tabs[2].open:
+        with tabs[2]:
+            show_settings(data)
+ 
+    prefetch_views(data)
+    watch_document()
@@ -0,0 +1,99 @@
+"""
+Program calendar, phases and copy
+"""
+ 
+from datetime import datetime
+ 
+from leptin.logs import DEFAULT_LOG
+ 
+ 
+CLEANING_VEGGIES = ["מלפפון", "עגבנייה", "בצל", "פטריות", "כרובית", "כרוב", "ברוקולי", "שעועית ירוקה", "קישוא", "חסה", "תרד"]
+ 
+# The cleanse phase's food rules, shown on its card and applied by the food catalog
+CLEANSE_FORBIDDEN = ["סוכר", "דבש", "קמח", "פסטה", "אורז", "תירס", "תפו״א"]
+CLEANSE_ALLOWED = ["עדשים", "חומוס", "שעועית", "קינואה", "כוסמת"]
+ 
+PSYCHOLOGY_TIPS = {
+    "water": [
+        "מים הם הדלק של הגוף. כל כוס מקרבת אותך להצלחה.",
+        "שתייה לפני אוכל = שליטה מלאה. אתה בוחר.",
+        "הגוף שלך צועק למים. תן לו מה שהוא צריך."
+    ],
+    "veggies": [
+        "ירקות = נשק סודי. הם עובדים בשבילך 24/7.",
+        "50% ירקות = 100% שליטה על הרעב.",
+        "כל ירק שאתה אוכל משנה את ההורמונים לטובתך."
+    ],
+    "general": [
+        "היום הזה לא יחזור. תעשה אותו נכון.",
+        "אתה לא צריך להיות מושלם. רק עקבי.",
+        "כל יום שאתה עומד ביעדים - הגוף משתנה.",
+        "ההצלחה שלך נבנית מהחלטות קטנות."
+    ],
+    "streak": [
+        "רצף של {} ימים! המומנטום בצד שלך.",
+        "יום {} ברצף - ההרגלים נבנים.",
+        "כבר {} ימים. אל תשבור את הרצף!"
+    ]
+}
+ 
+ 
+def get_today_key():
+    return datetime.now().strftime("%Y-%m-%d")
+ 
+ 
+def program_week(program_day):
+    """Week 1-13 of a program day; later days stay in week 13"""
+    return min(13, max(1, (program_day - 1) // 7 + 1))
+ 
+ 
+def calculate_program_day(start_date_str):
+    """Calculate current day and week from start date"""
+    try:
+        start = datetime.strptime(start_date_str, "%Y-%m-%d")
+        today = datetime.now()
+        delta = (today - start).days + 1
+        week = program_week(delta)
+        day_in_week = ((delta - 1) % 7) + 1
+        return delta, week, day_in_week
+    except:
+        return 1, 1, 1
+ 
+ 
+# (last week, (id, name, icon)) of each phase, in program order
+PHASES = [
+    (2, ("flood", "ההצפה", "🌊")),
+    (7, ("cleanse", "הניקוי", "✨")),
+    (8, ("transition", "מעבר", "🔄")),
+    (13, ("tracks", "המסלולים", "🎯")),
+]
+PHASE_BY_WEEK = {
+    week: next(phase for last, phase in PHASES if week <= last)
+    for week in range(1, PHASES[-1][0] + 1)
+}
+ 
+# Week-9+ tracks: id -> (name, what it eats)
+TRACKS = {
+    "fast": ("🚀 מהיר", "עדשים בלבד"),
+    "cleanse": ("✨ ניקוי", "קטניות + קינואה"),
+    "moderate": ("🍚 מתון", "אורז/תפו״א פעם ביום"),
+}
+ 
+ 
+def get_phase(week):
+    """(id, name, icon) of the phase a program week belongs to"""
+    return PHASE_BY_WEEK.get(week) or (PHASES[0][1] if week < 1 else PHASES[-1][1])
+ 
+ 
+def init_daily_log(data):
+    today = get_today_key()
+    if today not in data["daily_logs"]:
+        data["daily_logs"][today] = dict(DEFAULT_LOG)
+    return data
+ 
+ 
+def get_random_tip(category):
+    """Get a random psychology tip"""
+    import random
+    tips = PSYCHOLOGY_TIPS.get(category, PSYCHOLOGY_TIPS["general"])
+    return random.choice(tips)
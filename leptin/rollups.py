@@ -0,0 +1,110 @@
+"""
+Weekly, program-week, phase and monthly rollups
+"""
+ 
+from datetime import datetime
+ 
+from leptin.logs import day_ordinal, tracked_logs
+from leptin.program import get_phase, program_week
+from leptin.scoring import GOOD_DAY_SCORE, get_score
+from leptin.archive import archived_days
+from leptin.storage import archived_logs
+ 
+ 
+ROLLUP_TABLES = ("calendar_week", "program_week", "phase", "month")
+ROLLUP_COUNTERS = ("days", "good_days", "water_sum", "protein_days", "veggie_days", "treat_days")
+ 
+ 
+class Rollups:
+    """Per calendar week, program week, phase and month aggregates of the daily logs
+ 
+    The tables live in data["rollups"], so they are saved with the settings
+    and reused on the next load. Each day change subtracts the day's old
+    contribution and adds the new one; a full rebuild only happens when the
+    stored tables don't match the logs or the start date changed. Archived
+    days keep counting in the tables; a rebuild reads them back from storage.
+    """
+ 
+    def __init__(self, data):
+        self.logs = tracked_logs(data)
+        self.start_date = data["user_settings"].get("start_date")
+        self._start = day_ordinal(self.start_date) if self.start_date else None
+ 
+        self.stored = data.get("rollups")
+        if (not self.stored or self.stored.get("start_date") != self.start_date
+                or self.stored.get("days") != len(self.logs) + archived_days(data)):
+            self.stored = data["rollups"] = {
+                "start_date": self.start_date,
+                "days": 0,
+                "tables": {name: {} for name in ROLLUP_TABLES}
+            }
+            for date, log in archived_logs(data):
+                self._apply(date, log, 1)
+            for date, log in self.logs.items():
+                self._apply(date, log, 1)
+        self.logs.subscribe(self._added, before=self._removed)
+ 
+    def close(self):
+        self.logs.unsubscribe(self._added, before=self._removed)
+ 
+    def _keys(self, date):
+        day = datetime.fromisoformat(date)
+        keys = {"calendar_week": calendar_week_key(day), "month": date[:7]}
+        if self._start is not None:
+            week = program_week(day.toordinal() - self._start + 1)
+            keys["program_week"] = str(week)
+            keys["phase"] = get_phase(week)[0]
+        return keys
+ 
+    def _apply(self, date, log, sign):
+        contribution = {
+            "days": 1,
+            "good_days": int(get_score(date, log) >= GOOD_DAY_SCORE),
+            "water_sum": float(log.get("water_liters", 0)),
+            "protein_days": int(bool(log.get("protein_every_meal"))),
+            "veggie_days": int(bool(log.get("veggies_50_percent"))),
+            "treat_days": int(bool(log.get("treat_day")))
+        }
+        tables = self.stored["tables"]
+        for table, key in self._keys(date).items():
+            bucket = tables[table].setdefault(key, dict.fromkeys(ROLLUP_COUNTERS, 0))
+            for counter, value in contribution.items():
+                bucket[counter] += sign * value
+            if not bucket["days"]:
+                del tables[table][key]
+        self.stored["days"] += sign
+ 
+    def _added(self, date, log):
+        self._apply(date, log, 1)
+ 
+    def _removed(self, date, log):
+        self._apply(date, log, -1)
+ 
+    def get(self, table, key):
+        """Counters plus mean water and compliance rates for one bucket"""
+        bucket = dict(self.stored["tables"][table].get(key) or dict.fromkeys(ROLLUP_COUNTERS, 0))
+        days = bucket["days"]
+        bucket["mean_water"] = bucket["water_sum"] / days if days else 0
+        bucket["protein_rate"] = bucket["protein_days"] / days if days else 0
+        bucket["veggie_rate"] = bucket["veggie_days"] / days if days else 0
+        return bucket
+ 
+    def table(self, table):
+        return {key: self.get(table, key) for key in sorted(self.stored["tables"][table])}
+ 
+ 
+def get_rollups(data):
+    """The Rollups of data, rebuilt when the program start date changes"""
+    logs = tracked_logs(data)
+    with logs.lock:
+        rollups = logs.indexes.get("rollups")
+        if rollups is None or rollups.start_date != data["user_settings"].get("start_date"):
+            if rollups is not None:
+                rollups.close()
+            rollups = logs.indexes["rollups"] = Rollups(data)
+        return rollups
+ 
+ 
+def calendar_week_key(day):
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
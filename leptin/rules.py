@@ -0,0 +1,120 @@
+"""
+Phase rules as a precompiled table, one entry per program week and track
+ 
+Each entry has the phase, the finished HTML of the rules zone and what the
+today screen adds below it, so a rerun looks its rules up instead of
+branching on the phase and rebuilding markup. The flood and cleanse cards
+are fixed copy - the cleanse lists are the ones the food catalog applies -
+and the week-9+ cards come from the maintenance rows of "General
+Guidelines and Maintenance Program Instructions.xlsx". The table is
+compiled once per process and again when the workbook changes.
+"""
+ 
+import streamlit as st
+from collections import namedtuple
+import html
+import os
+ 
+from leptin.program import CLEANSE_ALLOWED, CLEANSE_FORBIDDEN, PHASES, TRACKS, get_phase
+from leptin.ui import STATIC_DIR, render_zone_header
+from leptin.workbook import read_workbook_rows
+ 
+ 
+GUIDELINES = os.path.join(os.path.dirname(STATIC_DIR), "General Guidelines and Maintenance Program Instructions.xlsx")
+ 
+PhaseRules = namedtuple("PhaseRules", "phase_id phase_name phase_icon html forbidden_check choose_track")
+ 
+PHASE_CARDS = {
+    "flood": """
+    <div class="psych-tip">
+        <div class="psych-tip-title">🌊 שלב ההצפה</div>
+        <div class="psych-tip-text">
+            התמקד במים וירקות בלבד!<br>
+            אין הגבלות מזון - רק בונים הרגלים.
+        </div>
+    </div>
+    """,
+    "cleanse": """
+    <div class="psych-tip" style="border-color: #ff6b35;">
+        <div class="psych-tip-title" style="color: #ff6b35;">✨ שלב הניקוי - כללים</div>
+        <div class="psych-tip-text">
+            <strong>🚫 אסור:</strong> {forbidden}<br>
+            <strong>✅ מותר:</strong> {allowed}
+        </div>
+    </div>
+    """.format(forbidden=", ".join(CLEANSE_FORBIDDEN), allowed=", ".join(CLEANSE_ALLOWED)),
+}
+ 
+# Words in a maintenance row's description that name its track
+TRACK_ROW_NAMES = {"fast": "Fast Track", "cleanse": "Cleaning Track", "moderate": "Moderate Track"}
+CARD_FIELDS = [
+    ("🍽️ מה אוכלים", "Food/Activity Details"),
+    ("📋 איך", "Instructions and Quantity"),
+    ("🗓️ מתי", "Frequency/Timing"),
+    ("🚫 הגבלות", "Key Restrictions"),
+]
+ 
+ 
+def _guideline_card(title, row):
+    """A psych-tip card of a workbook row; the workbook text is English, so it runs left to right"""
+    lines = "<br>\n            ".join(
+        f'<strong>{label}:</strong> <span dir="ltr">{html.escape(str(row[field]))}</span>'
+        for label, field in CARD_FIELDS if row.get(field)
+    )
+    return f"""
+    <div class="psych-tip">
+        <div class="psych-tip-title">{title}</div>
+        <div class="psych-tip-text">
+            {lines}
+        </div>
+    </div>
+    """
+ 
+ 
+def compile_phase_rules(rows):
+    """{(week, track): PhaseRules} for every program week and track, from the guideline rows"""
+    maintenance = ""
+    track_cards = {}
+    for row in rows:
+        category = str(row.get("Category") or "")
+        description = str(row.get("Guideline Description") or "")
+        if category == "Nutrition - Maintenance":
+            maintenance = _guideline_card("🛡️ עקרונות השימור", row)
+        elif category == "Maintenance Track":
+            for track, name in TRACK_ROW_NAMES.items():
+                if name in description:
+                    label, eats = TRACKS[track]
+                    track_cards[track] = _guideline_card(f"{label} - {eats}", row)
+ 
+    table = {}
+    for week in range(1, PHASES[-1][0] + 1):
+        phase_id, phase_name, phase_icon = get_phase(week)
+        header = f"""
+    <div class="zone-card">
+        {render_zone_header(phase_icon, f"כללי שלב {phase_name}", f"שבוע {week}")}
+    </div>
+    """
+        for track in (None, *TRACKS):
+            body = PHASE_CARDS.get(phase_id, "")
+            if phase_id == "tracks":
+                body = maintenance + track_cards.get(track, "")
+            table[(week, track)] = PhaseRules(
+                phase_id, phase_name, phase_icon, header + body,
+                forbidden_check=phase_id == "cleanse",
+                choose_track=phase_id == "tracks" and track is None
+            )
+    return table
+ 
+ 
+@st.cache_resource(max_entries=1)
+def _compile_rules(path, mtime):
+    return compile_phase_rules(read_workbook_rows(path) if path else [])
+ 
+ 
+def get_phase_rules(week, track=None):
+    """The PhaseRules of a program week and track - a lookup in the compiled table"""
+    try:
+        table = _compile_rules(GUIDELINES, os.path.getmtime(GUIDELINES))
+    except OSError:
+        table = _compile_rules(None, None)
+    return table.get((week, track)) or table[(week, None)]
@@ -0,0 +1,204 @@
+"""
+Write-behind saves to the gist
+"""
+ 
+import streamlit as st
+import json
+import os
+import threading
+import time
+import atexit
+ 
+from leptin.gist import get_gist_client
+ 
+ 
+# Durability contract:
+#   * GistStorage.save() snapshots the changed files and returns at once. The
+#     snapshot is written by a background thread once no newer save for the
+#     same gist arrived for SAVE_DEBOUNCE_SECONDS, and never later than
+#     SAVE_MAX_DELAY_SECONDS after the first unwritten change.
+#   * Saves for the same gist coalesce - each file is sent once, newest version.
+#   * Every snapshot is appended to a write-ahead log before save() returns,
+#     and the log is compacted to what is still unsent after each write.
+#     A restarted process replays the log, and loads lay it over the gist.
+#   * A failed write stays queued and is retried after SAVE_RETRY_SECONDS,
+#     unless a newer snapshot replaced it in the meantime - for as long as
+#     the gist is unreachable.
+#   * flush_saves() fsyncs the log and sends the queue without waiting for
+#     the debounce; it never waits on the network. It runs on "סיים את היום"
+#     and after settings changes. Interpreter shutdown still tries a write.
+#   * A process crash loses nothing; a power loss can lose the appends since
+#     the last flush_saves().
+ 
+SAVE_DEBOUNCE_SECONDS = 2.0
+SAVE_MAX_DELAY_SECONDS = 10.0
+SAVE_RETRY_SECONDS = 15.0
+ 
+ 
+class WriteAheadLog:
+    """Append-only file of queued saves, so unsent changes survive a restart
+ 
+    Each line is one put() as {"user": ..., "files": {...}}. Appends are
+    buffered writes - they survive the process dying, and sync() makes them
+    survive the machine too. rewrite() compacts the file down to what is
+    still unsent once the remote store has accepted a write.
+    """
+ 
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+ 
+    def entries(self):
+        """[(user, files)] in append order; a torn last line is skipped"""
+        found = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                found.append((entry["user"], entry["files"]))
+        return found
+ 
+    def append(self, user, files):
+        self._file.write(json.dumps({"user": user, "files": files}, ensure_ascii=False) + "\n")
+        self._file.flush()
+ 
+    def sync(self):
+        os.fsync(self._file.fileno())
+ 
+    def rewrite(self, pending):
+        """Replace the log with one line per user in {user: files}"""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for user, files in pending.items():
+                f.write(json.dumps({"user": user, "files": files}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._file.close()
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+ 
+ 
+class WriteBehindQueue:
+    """Coalesce gist writes per user and send them from a background thread
+ 
+    With a WriteAheadLog every put() is on disk before it returns, saves
+    left over from a previous process are replayed on start, and failed
+    writes keep retrying until the remote store is reachable again.
+    """
+ 
+    def __init__(self, write, debounce=SAVE_DEBOUNCE_SECONDS,
+                 max_delay=SAVE_MAX_DELAY_SECONDS, retry=SAVE_RETRY_SECONDS, wal=None):
+        self._write = write
+        self._debounce = debounce
+        self._max_delay = max_delay
+        self._retry = retry
+        self._wal = wal
+        self._pending = {}
+        self._inflight = {}
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        if wal:
+            now = time.monotonic()
+            for user, files in wal.entries():
+                entry = self._pending.setdefault(user, {"files": {}, "first": now, "due": now})
+                entry["files"].update(files)
+        self._thread = threading.Thread(target=self._run, name="leptin-write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+ 
+    def put(self, user, files):
+        """Queue {filename: content} for user's gist, merging with unwritten files"""
+        now = time.monotonic()
+        with self._cond:
+            if self._wal:
+                self._wal.append(user, files)
+            entry = self._pending.get(user)
+            if entry:
+                entry["files"].update(files)
+                entry["due"] = min(now + self._debounce, entry["first"] + self._max_delay)
+            else:
+                self._pending[user] = {
+                    "files": dict(files),
+                    "first": now,
+                    "due": now + self._debounce
+                }
+            self._cond.notify()
+ 
+    def flush(self, user=None):
+        """Write pending saves now (all users by default); False if a write failed"""
+        with self._write_lock:
+            with self._cond:
+                users = [user] if user is not None else list(self._pending)
+                entries = [(u, self._pending.pop(u)) for u in users if u in self._pending]
+            return self._write_entries(entries)
+ 
+    def sync(self, user=None):
+        """Make queued saves durable on disk and send them without waiting for the debounce"""
+        with self._cond:
+            if self._wal:
+                self._wal.sync()
+            for u, entry in self._pending.items():
+                if user is None or u == user:
+                    entry["due"] = min(entry["due"], time.monotonic())
+            self._cond.notify()
+ 
+    def pending_files(self, user):
+        """{filename: content} queued or being written for user, newest first to win"""
+        with self._cond:
+            files = dict(self._inflight.get(user, {}))
+            files.update(self._pending.get(user, {}).get("files", {}))
+            return files
+ 
+    def _write_entries(self, entries):
+        ok = True
+        with self._cond:
+            self._inflight = {user: entry["files"] for user, entry in entries}
+        for user, entry in entries:
+            if not self._write(user, entry["files"]):
+                ok = False
+                self._requeue(user, entry)
+        with self._cond:
+            self._inflight = {}
+            if self._wal and entries:
+                self._wal.rewrite({user: entry["files"] for user, entry in self._pending.items()})
+        return ok
+ 
+    def _requeue(self, user, entry):
+        now = time.monotonic()
+        with self._cond:
+            newer = self._pending.get(user)
+            if newer:
+                # Newer files win, but files only the failed write carried must survive
+                entry["files"].update(newer["files"])
+            entry["due"] = now + self._retry
+            self._pending[user] = entry
+            self._cond.notify()
+ 
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    due = [u for u, e in self._pending.items() if e["due"] <= now]
+                    if due:
+                        break
+                    timeout = min((e["due"] for e in self._pending.values()), default=None)
+                    self._cond.wait(None if timeout is None else timeout - now)
+            with self._write_lock:
+                with self._cond:
+                    entries = [(u, self._pending.pop(u)) for u in due if u in self._pending]
+                self._write_entries(entries)
+ 
+ 
+@st.cache_resource
+def get_save_queue():
+    """Process-wide write-behind queue shared by all sessions"""
+    client = get_gist_client()
+    # Entries are keyed by gist id; a replayed entry may name a gist other than the configured one
+    return WriteBehindQueue(
+        lambda gist_id, files: client.patch_files(files, gist_id),
+        wal=WriteAheadLog(os.path.join(client.cache_dir, "pending_saves.jsonl"))
+    )
@@ -0,0 +1,253 @@
+"""
+Daily score, batch scoring and the streak index
+"""
+ 
+import streamlit as st
+from datetime import datetime
+import numpy as np
+import functools
+import bisect
+from itertools import repeat
+ 
+from leptin.logs import DailyLogs, tracked_logs
+from leptin.program import get_today_key
+ 
+ 
+def calculate_score(log):
+    """Calculate daily score out of 100"""
+    score = 0
+ 
+    # Water (35 points)
+    water = log.get("water_liters", 0)
+    if water >= 2:
+        score += 15
+    if water >= 3:
+        score += 10
+    if water >= 4:
+        score += 5
+    if log.get("water_before_meals", 0) >= 3:
+        score += 5
+ 
+    # Veggies (25 points)
+    if log.get("veggies_50_percent"):
+        score += 25
+ 
+    # Protein (20 points)
+    if log.get("protein_every_meal"):
+        score += 20
+ 
+    # Fats limit (10 points)
+    if log.get("fats_count", 0) <= 3:
+        score += 10
+ 
+    # Eating window (10 points)
+    if 0 < log.get("eating_window_hours", 0) <= 12:
+        score += 10
+ 
+    # Penalty for forbidden food
+    if log.get("forbidden_food") and not log.get("treat_day"):
+        score -= 15
+ 
+    return max(0, min(100, score))
+ 
+ 
+# ===== BATCH SCORING =====
+ 
+_NUMBER_FIELDS = ("water_liters", "water_before_meals", "fats_count", "eating_window_hours")
+_FLAG_FIELDS = ("veggies_50_percent", "protein_every_meal", "forbidden_food", "treat_day")
+ 
+ 
+def log_columns(logs):
+    """Load {date: log} into NumPy columns, filling missing fields like calculate_score
+ 
+    Each column is one np.fromiter over a C-level map (dict.get, or getattr
+    on DailyLogs records), so no Python code runs per row.
+    """
+    dates = sorted(logs)
+    rows = list(map(logs.__getitem__, dates))
+    if isinstance(logs, DailyLogs):
+        def values(field, default):
+            return map(getattr, rows, repeat(field))
+    else:
+        def values(field, default):
+            return map(dict.get, rows, repeat(field), repeat(default))
+ 
+    columns = {"date": np.array(dates, dtype=object)}
+    for field in _NUMBER_FIELDS:
+        columns[field] = np.fromiter(values(field, 0), dtype=np.float64, count=len(rows))
+    for field in _FLAG_FIELDS:
+        columns[field] = np.fromiter(values(field, False), dtype=bool, count=len(rows))
+    return columns
+ 
+ 
+def score_columns(columns):
+    """calculate_score for every row of log_columns() in one vectorized pass
+ 
+    Every term is an integer, so the result is identical to the scalar path
+    day by day (benchmarks/bench_scoring.py checks this).
+    """
+    water = columns["water_liters"]
+    score = (
+        15 * (water >= 2) + 10 * (water >= 3) + 5 * (water >= 4)
+        + 5 * (columns["water_before_meals"] >= 3)
+        + 25 * columns["veggies_50_percent"]
+        + 20 * columns["protein_every_meal"]
+        + 10 * (columns["fats_count"] <= 3)
+        + 10 * ((columns["eating_window_hours"] > 0) & (columns["eating_window_hours"] <= 12))
+        - 15 * (columns["forbidden_food"] & ~columns["treat_day"])
+    ).astype(np.int64)
+    return np.clip(score, 0, 100)
+ 
+ 
+def score_logs(logs):
+    """{date: score} for a whole history at once"""
+    columns = log_columns(logs)
+    return dict(zip(columns["date"], score_columns(columns).tolist()))
+ 
+ 
+SCORE_FIELDS = (
+    "water_liters", "water_before_meals", "veggies_50_percent", "protein_every_meal",
+    "fats_count", "eating_window_hours", "forbidden_food", "treat_day"
+)
+SCORE_CACHE_SIZE = 4096
+ 
+ 
+@st.cache_resource
+def _get_score_cache():
+    """Process-wide LRU of scores; survives module reloads"""
+    @functools.lru_cache(maxsize=SCORE_CACHE_SIZE)
+    def score_for(date, fingerprint):
+        return calculate_score(dict(fingerprint))
+    return score_for
+ 
+ 
+def get_score(date, log):
+    """calculate_score memoized on the date plus the fields the score depends on"""
+    fingerprint = tuple((field, log[field]) for field in SCORE_FIELDS if field in log)
+    return _get_score_cache()(date, fingerprint)
+ 
+ 
+GOOD_DAY_SCORE = 70
+ 
+ 
+class StreakIndex:
+    """Runs of consecutive good days, kept up to date one changed day at a time
+ 
+    Days are program-independent date ordinals. Runs are stored as
+    start -> end with a sorted list of starts, so today's change is O(1)
+    and an edit inside older history is a bisect.
+    """
+ 
+    def __init__(self, logs):
+        self._runs = {}
+        self._ends = {}
+        self._starts = []
+        self._lengths = {}
+        self._good = set()
+        for date, log in logs.items():
+            self.update(date, log)
+        logs.subscribe(self.update, before=self.forget)
+ 
+    def forget(self, date, log):
+        """Take a day out of its run ahead of a change; update() puts it back unless it was deleted"""
+        self._set_good(datetime.strptime(date, "%Y-%m-%d").toordinal(), False)
+ 
+    def update(self, date, log):
+        day = datetime.strptime(date, "%Y-%m-%d").toordinal()
+        self._set_good(day, get_score(date, log) >= GOOD_DAY_SCORE)
+ 
+    def _set_good(self, day, good):
+        if good == (day in self._good):
+            return
+ 
+        if good:
+            self._good.add(day)
+            start, end = day, day
+            if day - 1 in self._ends:
+                start = self._ends[day - 1]
+                self._remove_run(start)
+            if day + 1 in self._runs:
+                end = self._runs[day + 1]
+                self._remove_run(day + 1)
+            self._add_run(start, end)
+        else:
+            self._good.discard(day)
+            start = self._run_start(day)
+            end = self._runs[start]
+            self._remove_run(start)
+            if start < day:
+                self._add_run(start, day - 1)
+            if day < end:
+                self._add_run(day + 1, end)
+ 
+    def _run_start(self, day):
+        if day in self._ends:
+            return self._ends[day]
+        return self._starts[bisect.bisect_right(self._starts, day) - 1]
+ 
+    def _add_run(self, start, end):
+        self._runs[start] = end
+        self._ends[end] = start
+        bisect.insort(self._starts, start)
+        length = end - start + 1
+        self._lengths[length] = self._lengths.get(length, 0) + 1
+ 
+    def _remove_run(self, start):
+        end = self._runs.pop(start)
+        del self._ends[end]
+        del self._starts[bisect.bisect_left(self._starts, start)]
+        length = end - start + 1
+        self._lengths[length] -= 1
+        if not self._lengths[length]:
+            del self._lengths[length]
+ 
+    def _carried(self, start, archive):
+        """Days of the archived run a run starting at start continues"""
+        if archive and archive.get("streak_end"):
+            if start == datetime.strptime(archive["through"], "%Y-%m-%d").toordinal() + 1:
+                return archive["streak_end"]
+        return 0
+ 
+    def current(self, date, archive=None):
+        """Length of the good-day run ending at (or passing through) date
+ 
+        archive is data["archive"]; a run that starts right after the
+        archived days continues the run they ended with.
+        """
+        day = datetime.strptime(date, "%Y-%m-%d").toordinal()
+        if day not in self._good:
+            return 0
+        start = self._run_start(day)
+        return day - start + 1 + self._carried(start, archive)
+ 
+    def longest(self, archive=None):
+        longest = max(self._lengths, default=0)
+        if archive:
+            longest = max(longest, archive["longest"])
+            first = datetime.strptime(archive["through"], "%Y-%m-%d").toordinal() + 1
+            if first in self._runs:
+                longest = max(longest, self._runs[first] - first + 1 + self._carried(first, archive))
+        return longest
+ 
+    def history(self):
+        """[(start_date, end_date, length)] for every run, oldest first"""
+        return [
+            (datetime.fromordinal(start).strftime("%Y-%m-%d"),
+             datetime.fromordinal(self._runs[start]).strftime("%Y-%m-%d"),
+             self._runs[start] - start + 1)
+            for start in self._starts
+        ]
+ 
+ 
+def get_streak_index(data):
+    """The StreakIndex of data's logs, built on first use"""
+    logs = tracked_logs(data)
+    with logs.lock:
+        if "streak" not in logs.indexes:
+            logs.indexes["streak"] = StreakIndex(logs)
+        return logs.indexes["streak"]
+ 
+ 
+def get_streak(data):
+    """Calculate current streak of good days"""
+    return get_streak_index(data).current(get_today_key(), data.get("archive"))
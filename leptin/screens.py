@@ -0,0 +1,343 @@
+"""
+The onboarding, today, history and settings screens
+"""
+ 
+import streamlit as st
+from datetime import datetime
+ 
+from leptin.storage import flush_saves, get_storage, save_data
+from leptin.program import CLEANING_VEGGIES, PSYCHOLOGY_TIPS, TRACKS, calculate_program_day, get_random_tip, get_today_key, init_daily_log
+from leptin.scoring import get_score, get_streak
+from leptin.rollups import calendar_week_key, get_rollups
+from leptin.ui import render_psych_tip
+from leptin.dashboard import dashboard_zone
+from leptin.catalog import get_food_catalog
+from leptin.rules import get_phase_rules
+ 
+ 
+def show_onboarding(data):
+    """Show onboarding for new users"""
+    st.markdown("""
+    <div class="hero-header">
+        <h1 class="hero-title">🔥 שיטת הלפטין</h1>
+        <p class="hero-subtitle">91 ימים שישנו לך את החיים</p>
+    </div>
+    """, unsafe_allow_html=True)
+ 
+    st.markdown("""
+    <div class="zone-card">
+        <h3 style="text-align: center; margin-bottom: 1.5rem;">בוא נתחיל את המסע</h3>
+    </div>
+    """, unsafe_allow_html=True)
+ 
+    name = st.text_input("השם שלך", placeholder="איך לקרוא לך?")
+ 
+    st.markdown("##### מתי התחלת את התוכנית?")
+    start_date = st.date_input(
+        "תאריך התחלה",
+        value=datetime.now(),
+        max_value=datetime.now(),
+        label_visibility="collapsed"
+    )
+ 
+    st.markdown("""
+    <div class="psych-tip">
+        <div class="psych-tip-title">💡 למה תאריך התחלה?</div>
+        <div class="psych-tip-text">האפליקציה תחשב אוטומטית באיזה יום ושבוע אתה, ותתאים את הכללים בהתאם לשלב שלך בתוכנית.</div>
+    </div>
+    """, unsafe_allow_html=True)
+ 
+    if st.button("🚀 יאללה, מתחילים!", use_container_width=True):
+        data["user_settings"]["name"] = name or "אלוף"
+        data["user_settings"]["start_date"] = start_date.strftime("%Y-%m-%d")
+        save_data(data)
+        flush_saves()
+        st.session_state["app_data"] = data
+        st.rerun()
+ 
+ 
+def show_daily_tracking(data):
+    """Main daily tracking interface"""
+    settings = data["user_settings"]
+    start_date = settings.get("start_date")
+    name = settings.get("name", "אלוף")
+ 
+    program_day, week, day_in_week = calculate_program_day(start_date)
+    rules = get_phase_rules(week, settings.get("track"))
+ 
+    today = get_today_key()
+    data = init_daily_log(data)
+    log = data["daily_logs"][today]
+ 
+    score = get_score(today, log)
+    streak = get_streak(data)
+ 
+    # Hero Header
+    st.markdown(f"""
+    <div class="hero-header">
+        <h1 class="hero-title">שלום, {name}!</h1>
+        <p class="hero-subtitle">{rules.phase_icon} שלב {rules.phase_name}</p>
+        <div class="day-badge">יום {program_day} | שבוע {week}</div>
+    </div>
+    """, unsafe_allow_html=True)
+ 
+    # Psychology tip
+    if streak > 0:
+        tip = PSYCHOLOGY_TIPS["streak"][streak % 3].format(streak)
+    else:
+        tip = get_random_tip("general")
+    st.markdown(render_psych_tip(tip), unsafe_allow_html=True)
+ 
+    # ===== ZONES 1-3: PROGRESS, WATER, NUTRITION, TIMING & FATS =====
+    dashboard_zone(data, today, program_day, week)
+ 
+    with st.expander("📋 ירקות מנקים"):
+        st.markdown(", ".join(CLEANING_VEGGIES))
+        st.markdown("**לא נכללים:** תפו״א, בטטה, גזר מבושל")
+ 
+    food_lookup_zone(week, settings.get("track"))
+ 
+    # ===== ZONE 4: PHASE RULES =====
+    st.markdown(rules.html, unsafe_allow_html=True)
+ 
+    if rules.forbidden_check and not log.get("treat_day"):
+        forbidden = st.checkbox("⚠️ אכלתי מזון אסור היום",
+                               value=log.get("forbidden_food", False),
+                               key="forbidden_check")
+        if forbidden != log.get("forbidden_food"):
+            log["forbidden_food"] = forbidden
+            save_data(data)
+ 
+    elif rules.choose_track:
+        st.markdown("**בחר מסלול:**")
+        track = st.radio("מסלול", list(TRACKS),
+                       format_func=lambda x: f"{TRACKS[x][0]} - {TRACKS[x][1]}",
+                       label_visibility="collapsed",
+                       horizontal=True)
+        if st.button("שמור מסלול"):
+            settings["track"] = track
+            save_data(data)
+            st.rerun()
+ 
+    # Treat day toggle
+    st.markdown("---")
+    treat = st.checkbox("🎉 יום פינוק", value=log.get("treat_day", False), key="treat_check")
+    if treat != log.get("treat_day"):
+        log["treat_day"] = treat
+        save_data(data)
+ 
+    if treat:
+        st.info("ביום פינוק עדיין חובה: מים + 50% ירקות")
+ 
+    # ===== RESCUE WHEELS =====
+    if score < 60 or log.get("forbidden_food"):
+        st.markdown("""
+        <div class="rescue-card">
+            <div class="rescue-title">🆘 גלגלי הצלה</div>
+        </div>
+        """, unsafe_allow_html=True)
+ 
+        rc1, rc2, rc3 = st.columns(3)
+        with rc1:
+            if st.button("💧 עוד מים", use_container_width=True):
+                st.success("הוסף 1-2 ליטר!")
+        with rc2:
+            if st.button("🥗 עוד ירקות", use_container_width=True):
+                st.success("הגדל ב-50%!")
+        with rc3:
+            if st.button("⏰ דחה ארוחה", use_container_width=True):
+                st.success("מחר דחה 1-3 שעות!")
+ 
+    # ===== COMPLETE DAY =====
+    st.markdown("---")
+    if st.button("✅ סיים את היום", use_container_width=True):
+        log["completed"] = True
+        save_data(data)
+        flush_saves()
+ 
+        if score >= 80:
+            st.balloons()
+            st.markdown("""
+            <div class="success-celebration">
+                <div class="success-icon">🏆</div>
+                <div class="success-text">יום מעולה! המשך כך!</div>
+            </div>
+            """, unsafe_allow_html=True)
+        elif score >= 60:
+            st.success("👍 יום טוב! מחר נשפר עוד קצת")
+        else:
+            st.info("💪 כל יום חדש הוא הזדמנות. מחר נעשה יותר טוב!")
+ 
+ 
+FOOD_STATUS_LABELS = {
+    "allowed": "✅ מותר",
+    "limited": "⚖️ במידה",
+    "forbidden": "🚫 אסור",
+    None: "❔ אין הנחיה בטבלה"
+}
+ 
+ 
+@st.fragment
+def food_lookup_zone(week, track):
+    """"Can I eat this?" against the food catalog; a query reruns only this fragment"""
+    query = st.text_input("🔎 מותר לי לאכול?", key="food_query", placeholder="הקלד שם של מאכל")
+    # The catalog is only touched once there is something to look up
+    if not query.strip():
+        return
+    catalog = get_food_catalog()
+    if catalog is None:
+        return
+ 
+    foods = catalog.search(query)
+    if not foods:
+        st.caption("לא נמצא בטבלת המזונות")
+    for food in foods:
+        cleansing = " · 🥒 ירק מנקה" if food.cleansing else ""
+        st.markdown(f"**{food.name}** - {FOOD_STATUS_LABELS[catalog.status(food, week, track)]}{cleansing}")
+ 
+ 
+HISTORY_PAGE_SIZE = 14
+ 
+ 
+def _load_older_history(pages):
+    st.session_state["history_pages"] = pages + 1
+ 
+ 
+def show_history(data):
+    """Show history view"""
+    st.markdown("""
+    <div class="zone-card">
+        <h2 style="text-align: center;">📅 היסטוריה</h2>
+    </div>
+    """, unsafe_allow_html=True)
+ 
+    logs = data.get("daily_logs", {})
+    if not logs:
+        st.info("אין עדיין היסטוריה")
+        return
+ 
+    # Weekly summary
+    start_date = data["user_settings"].get("start_date")
+    if start_date:
+        _, current_week, _ = calculate_program_day(start_date)
+ 
+        # Good days this (Monday-based) week, from the precomputed rollups
+        good_days = get_rollups(data).get("calendar_week", calendar_week_key(datetime.now()))["good_days"]
+ 
+        st.markdown(f"""
+        <div class="stats-grid">
+            <div class="stat-card">
+                <div class="stat-icon">📊</div>
+                <div class="stat-value">{good_days}/7</div>
+                <div class="stat-label">ימים טובים השבוע</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-icon">🔥</div>
+                <div class="stat-value">{get_streak(data)}</div>
+                <div class="stat-label">רצף נוכחי</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+ 
+    # Daily logs, one page at a time
+    pages = st.session_state.get("history_pages", 1)
+    shown = get_storage().recent_logs(data, HISTORY_PAGE_SIZE * pages)
+ 
+    for date_str, log in shown:
+        score = get_score(date_str, log)
+ 
+        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+        date_display = date_obj.strftime("%d/%m")
+        day_name = ["ראשון", "שני", "שלישי", "רביעי", "חמישי", "שישי", "שבת"][date_obj.weekday()]
+ 
+        if score >= 80:
+            status = "🏆"
+        elif score >= 60:
+            status = "✅"
+        else:
+            status = "⚠️"
+ 
+        treat = " 🎉" if log.get("treat_day") else ""
+ 
+        # Tracked expanders report .open, so closed days render only their label
+        expander = st.expander(f"{status} יום {day_name} ({date_display}) - {score}%{treat}",
+                               key=f"history_{date_str}", on_change="rerun")
+        if expander.open:
+            with expander:
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown(f"💧 מים: {log.get('water_liters', 0)} ליטר")
+                    st.markdown(f"🥗 ירקות: {'✅' if log.get('veggies_50_percent') else '❌'}")
+                with col2:
+                    st.markdown(f"🍗 חלבון: {'✅' if log.get('protein_every_meal') else '❌'}")
+                    st.markdown(f"🥑 שומנים: {log.get('fats_count', 0)} כפות")
+ 
+    if len(shown) == HISTORY_PAGE_SIZE * pages:
+        st.button("⬇️ טען ימים קודמים", use_container_width=True,
+                  on_click=_load_older_history, args=(pages,))
+ 
+ 
+def show_settings(data):
+    """Settings page"""
+    st.markdown("""
+    <div class="zone-card">
+        <h2 style="text-align: center;">⚙️ הגדרות</h2>
+    </div>
+    """, unsafe_allow_html=True)
+ 
+    settings = data["user_settings"]
+ 
+    # Current status
+    if settings.get("start_date"):
+        program_day, week, _ = calculate_program_day(settings["start_date"])
+        st.markdown(f"""
+        <div class="stats-grid">
+            <div class="stat-card">
+                <div class="stat-icon">📅</div>
+                <div class="stat-value">יום {program_day}</div>
+                <div class="stat-label">בתוכנית</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-icon">📆</div>
+                <div class="stat-value">שבוע {week}</div>
+                <div class="stat-label">מתוך 13</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+ 
+    st.markdown("---")
+ 
+    # Edit settings
+    new_name = st.text_input("שם", value=settings.get("name", ""))
+ 
+    new_start = st.date_input(
+        "תאריך התחלה",
+        value=datetime.strptime(settings["start_date"], "%Y-%m-%d") if settings.get("start_date") else datetime.now()
+    )
+ 
+    if week >= 9:
+        new_track = st.radio(
+            "מסלול",
+            list(TRACKS),
+            index=list(TRACKS).index(settings.get("track") or "fast"),
+            format_func=lambda x: TRACKS[x][0],
+            horizontal=True
+        )
+    else:
+        new_track = None
+ 
+    if st.button("💾 שמור שינויים", use_container_width=True):
+        settings["name"] = new_name
+        settings["start_date"] = new_start.strftime("%Y-%m-%d")
+        if new_track:
+            settings["track"] = new_track
+        save_data(data)
+        flush_saves()
+        st.success("נשמר!")
+        st.rerun()
+ 
+    st.markdown("---")
+ 
+    if st.button("🚪 התנתק", use_container_width=True):
+        st.session_state.authenticated = False
+        st.rerun()
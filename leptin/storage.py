@@ -0,0 +1,419 @@
+"""
+Storage backends and the save entry points
+"""
+ 
+import streamlit as st
+import json
+import threading
+import time
+import sqlite3
+ 
+from leptin.logs import DEFAULT_LOG, DailyLogs, get_default_data, settings_document, tracked_logs
+from leptin.gist import (gist_files_from_data, get_archived_gist_logs, get_gist_client,
+                         get_gist_data, save_gist_data)
+from leptin.archive import archive_cold_days, archive_horizon, archived_through
+from leptin.savequeue import get_save_queue
+ 
+ 
+class Storage:
+    """Interface every storage backend implements
+ 
+    load() returns the document with its recent days (older ones are
+    archived, see leptin.archive), save() persists the settings and the
+    unsaved days, flush() blocks until earlier saves are durable and
+    read_archive() returns the archived days and is_current() tells whether a
+    loaded document still matches the stored one. The range queries default
+    to in-memory lookups on the loaded document.
+    document_key names the stored document in the shared document cache.
+    """
+ 
+    document_key = "default"
+ 
+    def load(self):
+        raise NotImplementedError
+ 
+    def save(self, data):
+        raise NotImplementedError
+ 
+    def flush(self):
+        return True
+ 
+    def read_archive(self, data):
+        """{date: log} of the archived days"""
+        return {}
+ 
+    def is_current(self, data):
+        """Whether data is still what storage holds; only this process writes by default"""
+        return True
+ 
+    def recent_logs(self, data, limit, offset=0):
+        """[(date, log)] for `limit` days, newest first, skipping the newest `offset`
+ 
+        Pages past the loaded days continue into the archive.
+        """
+        logs = tracked_logs(data)
+        shown = logs.recent(limit, offset)
+        if len(shown) < limit:
+            skip = max(0, offset - len(logs))
+            shown += archived_logs(data)[skip:skip + limit - len(shown)]
+        return shown
+ 
+    def day_history(self, date):
+        """[(timestamp, log)] - every state the day went through, oldest first
+ 
+        Rebuilt from the event log, as far back as it goes; log is None
+        once the day was deleted. Backends without an event log return [].
+        """
+        return []
+ 
+ 
+class GistStorage(Storage):
+    """GitHub Gist backend - month files written through the write-behind queue"""
+ 
+    document_key = "gist"
+ 
+    def _unsent(self):
+        client = get_gist_client()
+        return get_save_queue().pending_files(client.gist_id) if client.gist_id else None
+ 
+    def load(self):
+        return archive_cold_days(get_gist_data(self._unsent()), archive_horizon())
+ 
+    def read_archive(self, data):
+        return get_archived_gist_logs(archived_through(data), self._unsent())
+ 
+    def is_current(self, data):
+        # Another device or process may have saved to the gist since it was loaded
+        client = get_gist_client()
+        if not client.token or not client.gist_id:
+            return True
+        try:
+            return client.is_current()
+        except Exception:
+            # Unreachable: keep serving what is loaded
+            return True
+ 
+    def save(self, data):
+        client = get_gist_client()
+        # The month files are this backend's history; it keeps no event log
+        tracked_logs(data).take_events()
+ 
+        if not client.token:
+            return False
+ 
+        if not client.gist_id:
+            # Creating the gist has to happen in the foreground to show the new id
+            return save_gist_data(data)
+ 
+        logs = tracked_logs(data)
+        with logs.lock:
+            unsaved = set(logs.dirty)
+            files = gist_files_from_data(data)
+        try:
+            get_save_queue().put(client.gist_id, files)
+        except OSError:
+            # The write-ahead log could not take it; the next save sends these days again
+            with logs.lock:
+                logs.dirty.update(unsaved)
+            return False
+        return True
+ 
+    def flush(self):
+        # Durable once it is in the write-ahead log; the network write
+        # happens in the background and retries until the gist is reachable
+        get_save_queue().sync()
+        return True
+ 
+ 
+class SQLiteStorage(Storage):
+    """Local SQLite backend - an append-only event log over periodic day snapshots
+ 
+    Saves append the journaled changes to the events table. Every
+    SNAPSHOT_EVERY events the days they touched are written to daily_logs
+    and the snapshot position moves on; load reads the snapshot and
+    replays the events after it. Range queries use the loaded document,
+    since daily_logs alone lags behind the event tail.
+    """
+ 
+    def __init__(self, path, user):
+        self.user = user
+        self.document_key = f"sqlite:{user}"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = ", ".join(f"{field} {LOG_COLUMN_TYPES[type(default)]}"
+                            for field, default in DEFAULT_LOG.items())
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                "user TEXT PRIMARY KEY, document TEXT NOT NULL)"
+            )
+            # The (user, date) primary key doubles as the index for date-range scans
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS daily_logs ("
+                f"user TEXT NOT NULL, date TEXT NOT NULL, {columns}, "
+                f"PRIMARY KEY (user, date)) WITHOUT ROWID"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, user TEXT NOT NULL, date TEXT NOT NULL, "
+                "field TEXT, op TEXT NOT NULL, value TEXT, ts REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS events_day ON events (user, date, seq)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "user TEXT PRIMARY KEY, seq INTEGER NOT NULL)"
+            )
+        fields = list(DEFAULT_LOG)
+        self._select = f"SELECT date, {', '.join(fields)} FROM daily_logs WHERE user = ?"
+        self._upsert = (
+            f"INSERT INTO daily_logs (user, date, {', '.join(fields)}) "
+            f"VALUES (?, ?, {', '.join('?' for _ in fields)}) "
+            f"ON CONFLICT (user, date) DO UPDATE SET "
+            + ", ".join(f"{field} = excluded.{field}" for field in fields)
+        )
+ 
+    def _snapshot_seq(self):
+        row = self._conn.execute("SELECT seq FROM snapshots WHERE user = ?", (self.user,)).fetchone()
+        return row[0] if row else 0
+ 
+    def _query_events(self, where, params=()):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, field, op, value, ts FROM events WHERE user = ? " + where,
+                (self.user, *params)
+            ).fetchall()
+        return [(date, field, op, json.loads(value), ts) for date, field, op, value, ts in rows]
+ 
+    def _query_logs(self, where="", params=()):
+        with self._lock:
+            rows = self._conn.execute(self._select + where, (self.user, *params)).fetchall()
+        return [(row[0], _log_from_row(row[1:])) for row in rows]
+ 
+    def load(self):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT document FROM documents WHERE user = ?", (self.user,)
+            ).fetchone()
+        if row is None:
+            return get_default_data()
+ 
+        data = json.loads(row[0])
+        through = archived_through(data)
+        with self._lock:
+            snapshot = self._snapshot_seq()
+        logs = DailyLogs(dict(self._query_logs(" AND date > ? ORDER BY date", (through,))))
+        logs.replay(self._query_events("AND seq > ? AND date > ? ORDER BY seq", (snapshot, through)))
+        data["daily_logs"] = logs
+ 
+        horizon = archive_horizon()
+        if logs.before(horizon):
+            # Archived days are read from daily_logs alone, so snapshot the tail first
+            with self._lock, self._conn:
+                self._compact(data, force=True)
+        return archive_cold_days(data, horizon)
+ 
+    def read_archive(self, data):
+        return dict(self._query_logs(" AND date <= ?", (archived_through(data),)))
+ 
+    def save(self, data):
+        logs = tracked_logs(data)
+        # Under the lock, so another session's edit can't land between taking
+        # the changes and serializing them
+        with logs.lock:
+            dirty = logs.take_dirty()
+            journal = logs.take_events()
+            journaled = {event[0] for event in journal}
+            # Days changed behind the journal's back (legacy documents) go in as whole-day events
+            now = time.time()
+            events = journal + [(date, None, "put", logs[date].to_dict(), now)
+                                for date in sorted(dirty - journaled) if date in logs]
+            document = json.dumps(settings_document(data), ensure_ascii=False)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO documents (user, document) VALUES (?, ?) "
+                    "ON CONFLICT (user) DO UPDATE SET document = excluded.document",
+                    (self.user, document)
+                )
+                self._conn.executemany(
+                    "INSERT INTO events (user, date, field, op, value, ts) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(self.user, date, field, op, json.dumps(value, ensure_ascii=False), ts)
+                     for date, field, op, value, ts in events]
+                )
+                if events:
+                    self._compact(data)
+            return True
+        except sqlite3.Error:
+            with logs.lock:
+                logs.dirty.update(dirty)
+                logs.events[:0] = journal
+            return False
+ 
+    def _compact(self, data, force=False):
+        """Write the days touched since the last snapshot once enough events piled up
+ 
+        Runs inside a transaction of the caller. Another session may change
+        a day after its events were taken, so the snapshot can be slightly
+        ahead of its position; replaying those (absolute) events again is harmless.
+        """
+        logs = tracked_logs(data)
+        snapshot = self._snapshot_seq()
+        count, last = self._conn.execute(
+            "SELECT COUNT(*), MAX(seq) FROM events WHERE user = ? AND seq > ?", (self.user, snapshot)
+        ).fetchone()
+        if not count or (count < SNAPSHOT_EVERY and not force):
+            return
+ 
+        # Archived days are not loaded, which doesn't make them deleted
+        dates = [row[0] for row in self._conn.execute(
+            "SELECT DISTINCT date FROM events WHERE user = ? AND seq > ? AND date > ?",
+            (self.user, snapshot, archived_through(data))
+        )]
+        self._conn.executemany(
+            self._upsert,
+            [(self.user, date, *_row_from_log(logs[date])) for date in dates if date in logs]
+        )
+        self._conn.executemany(
+            "DELETE FROM daily_logs WHERE user = ? AND date = ?",
+            [(self.user, date) for date in dates if date not in logs]
+        )
+        self._conn.execute(
+            "INSERT INTO snapshots (user, seq) VALUES (?, ?) "
+            "ON CONFLICT (user) DO UPDATE SET seq = excluded.seq",
+            (self.user, last)
+        )
+ 
+    def day_history(self, date):
+        states, log = [], dict(DEFAULT_LOG)
+        for _, field, op, value, ts in self._query_events("AND date = ? ORDER BY seq", (date,)):
+            if op == "put":
+                log = dict(value)
+            elif op == "del":
+                log = None
+            else:
+                log = dict(log or DEFAULT_LOG, **{field: value})
+            states.append((ts, log))
+        return states
+ 
+ 
+SNAPSHOT_EVERY = 200
+LOG_COLUMN_TYPES = {bool: "INTEGER", int: "INTEGER", float: "REAL", str: "TEXT"}
+ 
+ 
+def _row_from_log(log):
+    return [log.get(field, default) for field, default in DEFAULT_LOG.items()]
+ 
+ 
+def _log_from_row(row):
+    return {
+        field: type(default)(value) if value is not None else default
+        for (field, default), value in zip(DEFAULT_LOG.items(), row)
+    }
+ 
+ 
+def archived_logs(data):
+    """[(date, log)] of the archived days, newest first, read from storage on first use"""
+    through = archived_through(data)
+    if not through:
+        return []
+    logs = tracked_logs(data)
+    with logs.lock:
+        cached = logs.indexes.get("archive")
+        if cached is None or cached[0] != through:
+            days = sorted(get_storage().read_archive(data).items(), reverse=True)
+            cached = logs.indexes["archive"] = (through, days)
+        return cached[1]
+ 
+ 
+@st.cache_resource
+def get_storage():
+    """The configured storage backend, shared by all sessions"""
+    if st.secrets.get("STORAGE_BACKEND", "gist") == "sqlite":
+        return SQLiteStorage(
+            st.secrets.get("SQLITE_PATH", "leptin_data.db"),
+            st.secrets.get("USER_ID", "default")
+        )
+    return GistStorage()
+ 
+ 
+class SharedDocuments:
+    """Loaded documents shared by every session in the process, one per document key
+ 
+    Sessions hold a reference instead of a copy, so an edit in one session is
+    already the other sessions' data and nobody saves a stale snapshot.
+    Versions count saves, letting a session see that another one changed
+    the document since it last rendered.
+    """
+ 
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._documents = {}
+        self._load_locks = {}
+        self._versions = {}
+ 
+    def get(self, key, load, is_current=None):
+        """The document for key, loaded once even when sessions ask concurrently
+ 
+        is_current(document) is asked when a session attaches to a loaded
+        document; a stale one is loaded again and replaces it for everyone.
+        """
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            document = self._documents.get(key)
+            if document is not None and is_current and not is_current(document):
+                with self._lock:
+                    del self._documents[key]
+                    self._versions[key] = self._versions.get(key, 0) + 1
+                document = None
+            if document is None:
+                document = load()
+                # An empty document may be a failed fetch; keep it private so
+                # the next session retries, until its first save shares it
+                if document["user_settings"].get("start_date"):
+                    self._documents[key] = document
+            return document
+ 
+    def version(self, key):
+        return self._versions.get(key, 0)
+ 
+    def shared(self, key):
+        """The document sessions share for key, or None"""
+        return self._documents.get(key)
+ 
+    def bump(self, key, document):
+        """Record a save of document, sharing it if it is not shared yet"""
+        with self._lock:
+            self._documents.setdefault(key, document)
+            self._versions[key] = self._versions.get(key, 0) + 1
+            return self._versions[key]
+ 
+ 
+@st.cache_resource
+def get_shared_documents():
+    return SharedDocuments()
+ 
+ 
+def load_document():
+    """The active backend's document, loaded once per process and shared by all sessions"""
+    storage = get_storage()
+    return get_shared_documents().get(storage.document_key, storage.load, storage.is_current)
+ 
+ 
+def document_version():
+    return get_shared_documents().version(get_storage().document_key)
+ 
+ 
+def save_data(data):
+    """Persist the settings and the changed days through the active backend"""
+    storage = get_storage()
+    # This session has seen its own change; only the others need to rerun
+    st.session_state["document_version"] = get_shared_documents().bump(storage.document_key, data)
+    return storage.save(data)
+ 
+ 
+def flush_saves():
+    """Block until every queued save is durable"""
+    return get_storage().flush()
@@ -0,0 +1,104 @@
+"""
+Stylesheet and HTML building blocks
+"""
+ 
+import streamlit as st
+import hashlib
+import os
+ 
+ 
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+ 
+ 
+FONTS_DIR = os.path.join(STATIC_DIR, "fonts")
+# Self-hosted Heebo subsets (scripts/fetch_heebo.py): the Hebrew one covers
+# the UI, the Latin one only numbers and punctuation
+FONT_SUBSETS = {
+    "hebrew": "U+0307-0308, U+0590-05FF, U+200C-2010, U+20AA, U+25CC, U+FB1D-FB4F",
+    "latin": "U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, U+0304, U+2000-206F, "
+             "U+20AC, U+2122, U+2191, U+2193, U+2212, U+2215, U+FEFF, U+FFFD",
+}
+GOOGLE_FONTS_CSS = "https://fonts.googleapis.com/css2?family=Heebo:wght@300..800&display=swap"
+ 
+ 
+def _content_version(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+ 
+ 
+@st.cache_resource
+def stylesheet_url():
+    """URL of static/app.css with a content hash, so browsers cache it until it changes"""
+    return f"app/static/app.css?v={_content_version(os.path.join(STATIC_DIR, 'app.css'))}"
+ 
+ 
+@st.cache_resource
+def font_faces():
+    """Heebo @font-face rules with content-hashed URLs of the static/fonts subsets
+ 
+    A deployment without the woff2 files loads Heebo from Google Fonts instead.
+    """
+    faces = []
+    for subset, unicode_range in FONT_SUBSETS.items():
+        path = os.path.join(FONTS_DIR, f"heebo-{subset}.woff2")
+        if not os.path.exists(path):
+            return f'<link rel="stylesheet" href="{GOOGLE_FONTS_CSS}">'
+        url = f"app/static/fonts/heebo-{subset}.woff2?v={_content_version(path)}"
+        faces.append(
+            "@font-face{font-family:'Heebo';font-style:normal;font-weight:300 800;font-display:swap;"
+            f"src:local('Heebo'),url('{url}') format('woff2');unicode-range:{unicode_range}}}"
+        )
+    return f"<style>{''.join(faces)}</style>"
+ 
+ 
+def inject_stylesheet():
+    """Only these tags travel with each rerun; the stylesheet and fonts come from the browser cache"""
+    st.markdown(f'{font_faces()}<link rel="stylesheet" href="{stylesheet_url()}">', unsafe_allow_html=True)
+ 
+ 
+def render_skeleton():
+    """Placeholder for the today screen: hero, rings and two zone cards"""
+    card = """
+    <div class="zone-card">
+        <div class="skeleton-line" style="width: 40%; margin-right: 0;"></div>
+        <div class="skeleton-line" style="width: 100%;"></div>
+        <div class="skeleton-line" style="width: 70%;"></div>
+    </div>
+    """
+    return f"""
+    <div class="hero-header">
+        <div class="skeleton-line" style="width: 50%; height: 1.8rem;"></div>
+        <div class="skeleton-line" style="width: 35%;"></div>
+    </div>
+    <div class="zone-card">
+        <div class="progress-ring-container">
+            <div class="skeleton-ring"></div>
+            <div class="skeleton-ring"></div>
+        </div>
+    </div>
+    {card}
+    {card}
+    """
+ 
+ 
+def render_zone_header(icon, title, subtitle=""):
+    """Render a zone section header"""
+    return f"""
+    <div class="zone-header">
+        <div class="zone-icon">{icon}</div>
+        <div>
+            <h3 class="zone-title">{title}</h3>
+            <p class="zone-subtitle">{subtitle}</p>
+        </div>
+    </div>
+    """
+ 
+ 
+def render_psych_tip(tip):
+    """Render a psychology tip box"""
+    return f"""
+    <div class="psych-tip">
+        <div class="psych-tip-title">🧠 תזכורת מנטלית</div>
+        <div class="psych-tip-text">{tip}</div>
+    </div>
+    """
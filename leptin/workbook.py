@@ -0,0 +1,16 @@
+"""
+Reading the program's Excel workbooks
+"""
+ 
+ 
+def read_workbook_rows(path):
+    """A workbook's first sheet as {header: value} dicts"""
+    # Imported here: workbooks are only read when what was compiled from them is stale
+    import openpyxl
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows)
+        return [dict(zip(header, row)) for row in rows if any(row)]
+    finally:
+        workbook.close()
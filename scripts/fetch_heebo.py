@@ -0,0 +1,44 @@
+"""
+Download the Hebrew and Latin subsets of the Heebo variable font into static/fonts
+Run once from the repository root: python scripts/fetch_heebo.py, then commit
+static/fonts - leptin/ui.py serves the files with content-hashed URLs
+"""
+ 
+import os
+import re
+import sys
+ 
+import requests
+ 
+CSS_URL = "https://fonts.googleapis.com/css2?family=Heebo:wght@300..800&display=swap"
+SUBSETS = ("hebrew", "latin")
+FONTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static", "fonts")
+ 
+# Google Fonts only serves woff2 to browsers it recognises
+USER_AGENT = "Mozilla/5.0 (Linux; Android 14) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Mobile Safari/537.36"
+ 
+ 
+def main():
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    css = session.get(CSS_URL, timeout=30)
+    css.raise_for_status()
+ 
+    # Each @font-face block is preceded by a /* subset */ comment
+    urls = dict(re.findall(r"/\* ([\w-]+) \*/\s*@font-face \{[^}]*?url\((\S+?\.woff2)\)", css.text))
+    missing = [subset for subset in SUBSETS if subset not in urls]
+    if missing:
+        sys.exit(f"Subsets not found in the Google Fonts response: {', '.join(missing)}")
+ 
+    os.makedirs(FONTS_DIR, exist_ok=True)
+    for subset in SUBSETS:
+        font = session.get(urls[subset], timeout=30)
+        font.raise_for_status()
+        path = os.path.join(FONTS_DIR, f"heebo-{subset}.woff2")
+        with open(path, "wb") as f:
+            f.write(font.content)
+        print(f"{path}: {len(font.content) // 1024} KB")
+ 
+ 
+if __name__ == "__main__":
+    main()
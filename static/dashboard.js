@@ -0,0 +1,254 @@
+// Today dashboard: rings, counters and toggles that update in the browser.
+// Edits collect in `pending` and go back to Python as one "sync" trigger
+// when the user pauses, leaves the page or the tab loses focus.
+
+const RING_RADIUS = 52;
+const RING_CIRCUMFERENCE = 2 * Math.PI * RING_RADIUS;
+
+// Per-day state survives re-renders and remounts: the module is loaded once per page
+const sessions = new Map();
+
+// Same rules as calculate_score in leptin/scoring.py
+function calculateScore(log) {
+    let score = 0;
+    const water = log.water_liters || 0;
+    if (water >= 2) score += 15;
+    if (water >= 3) score += 10;
+    if (water >= 4) score += 5;
+    if ((log.water_before_meals || 0) >= 3) score += 5;
+    if (log.veggies_50_percent) score += 25;
+    if (log.protein_every_meal) score += 20;
+    if ((log.fats_count || 0) <= 3) score += 10;
+    const window = log.eating_window_hours || 0;
+    if (window > 0 && window <= 12) score += 10;
+    if (log.forbidden_food && !log.treat_day) score -= 15;
+    return Math.max(0, Math.min(100, score));
+}
+
+function ring(name, label, color) {
+    return `
+    <div class="progress-ring">
+        <svg width="120" height="120">
+            <circle class="progress-ring-circle" cx="60" cy="60" r="${RING_RADIUS}"/>
+            <circle class="progress-ring-progress" cx="60" cy="60" r="${RING_RADIUS}"
+                stroke="${color}" stroke-dasharray="${RING_CIRCUMFERENCE}" data-ring="${name}"/>
+        </svg>
+        <div class="progress-ring-text">
+            <div class="progress-ring-value" data-ring-value="${name}"></div>
+            <div class="progress-ring-label">${label}</div>
+        </div>
+    </div>`;
+}
+
+function counter(field, unit, middle = `<span data-value="${field}"></span> ${unit}`) {
+    return `
+    <div class="dash-counter">
+        <button class="counter-btn" data-step="${field}" data-sign="-1">➖</button>
+        <div class="dash-counter-value">${middle}</div>
+        <button class="counter-btn" data-step="${field}" data-sign="1">➕</button>
+    </div>`;
+}
+
+function toggle(field, icon, title) {
+    return `
+    <div class="check-item" data-toggle="${field}">
+        <div class="check-icon">${icon}</div>
+        <div class="check-content"><p class="check-title">${title}</p></div>
+        <div class="check-status"></div>
+    </div>`;
+}
+
+const MARKUP = `
+<div class="zone-card">
+    <div class="progress-ring-container">
+        ${ring("score", "ציון יומי", "#e94560")}
+        ${ring("weeks", "שבועות", "#00d9a5")}
+    </div>
+    <div class="stats-grid">
+        <div class="stat-card">
+            <div class="stat-icon">🔥</div>
+            <div class="stat-value" data-stat="streak"></div>
+            <div class="stat-label">ימים ברצף</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-icon">📅</div>
+            <div class="stat-value" data-stat="program_day"></div>
+            <div class="stat-label">ימים בתוכנית</div>
+        </div>
+    </div>
+</div>
+<div class="zone-card">
+    <div class="zone-header">
+        <div class="zone-icon">💧</div>
+        <div>
+            <h3 class="zone-title">הצפת הלפטין</h3>
+            <p class="zone-subtitle">2-4 ליטר + 2 כוסות לפני כל ארוחה</p>
+        </div>
+    </div>
+    <div class="metric-display">
+        <div class="metric-value" data-value="water_liters"></div>
+        <div class="metric-unit">ליטר</div>
+        <div class="metric-target">יעד: 3-4 ליטר</div>
+    </div>
+    ${counter("water_liters", "", '<input class="dash-range" type="range" data-range="water_liters">')}
+    <p class="dash-label">2 כוסות לפני ארוחה:</p>
+    ${counter("water_before_meals", "/ 3 ארוחות")}
+</div>
+<div class="zone-card">
+    <div class="zone-header">
+        <div class="zone-icon">🥗</div>
+        <div>
+            <h3 class="zone-title">תזונה</h3>
+            <p class="zone-subtitle">ירקות מנקים + חלבון</p>
+        </div>
+    </div>
+    ${toggle("veggies_50_percent", "🥒", "אכלתי 50% ירקות מנקים לפחות ב-2 ארוחות")}
+    ${toggle("protein_every_meal", "🍗", "כללתי חלבון בכל ארוחה")}
+</div>
+<div class="zone-card">
+    <div class="zone-header">
+        <div class="zone-icon">⏰</div>
+        <div>
+            <h3 class="zone-title">תזמון ושומנים</h3>
+            <p class="zone-subtitle">חלון אכילה + שומנים מרוכזים</p>
+        </div>
+    </div>
+    <p class="dash-label">חלון אכילה (שעות): <span data-value="eating_window_hours"></span></p>
+    <input class="dash-range" type="range" data-range="eating_window_hours">
+    <p class="dash-note" data-window-note></p>
+    <p class="dash-label">שומנים מרוכזים (כפות):</p>
+    ${counter("fats_count", "כפות")}
+    <p class="dash-note">טחינה, שמן, אבוקדו - מקסימום 2-3 כפות</p>
+</div>`;
+
+function windowNote(hours) {
+    if (hours <= 0) return ["", ""];
+    if (hours <= 10) return [`✅ חלון ${hours} שעות - מצוין!`, "good"];
+    if (hours <= 12) return [`👍 חלון ${hours} שעות - טוב`, "ok"];
+    return [`⚠️ חלון ${hours} שעות - נסה לקצר`, "bad"];
+}
+
+function paint(root, session) {
+    const { data, values } = session;
+    const score = calculateScore(values);
+    const rings = { score: score, weeks: (Math.min(data.week, data.weeks) / data.weeks) * 100 };
+    for (const [name, percentage] of Object.entries(rings)) {
+        root.querySelector(`[data-ring="${name}"]`).setAttribute(
+            "stroke-dashoffset", RING_CIRCUMFERENCE - (percentage / 100) * RING_CIRCUMFERENCE);
+        root.querySelector(`[data-ring-value="${name}"]`).textContent = `${Math.trunc(percentage)}%`;
+    }
+
+    const streak = score >= data.good_day_score ? data.streak_before + 1 : 0;
+    root.querySelector('[data-stat="streak"]').textContent = streak;
+    root.querySelector('[data-stat="program_day"]').textContent = `${data.program_day}/${data.days}`;
+
+    root.querySelectorAll("[data-value]").forEach((el) => {
+        el.textContent = values[el.dataset.value];
+    });
+    root.querySelectorAll("[data-toggle]").forEach((el) => {
+        const done = Boolean(values[el.dataset.toggle]);
+        el.classList.toggle("completed", done);
+        el.querySelector(".check-status").textContent = done ? "✓" : "○";
+    });
+    root.querySelectorAll("[data-range]").forEach((el) => {
+        el.value = values[el.dataset.range];
+    });
+
+    const fats = root.querySelector('[data-value="fats_count"]').closest(".dash-counter");
+    fats.classList.toggle("over", values.fats_count > 3);
+
+    const [note, level] = windowNote(values.eating_window_hours);
+    const noteEl = root.querySelector("[data-window-note]");
+    noteEl.textContent = note;
+    noteEl.dataset.level = level;
+}
+
+function flush(session) {
+    clearTimeout(session.timer);
+    session.timer = null;
+    if (!Object.keys(session.pending).length) return;
+    session.seq += 1;
+    session.sentSeq = session.seq;
+    session.setTriggerValue("sync", { date: session.data.date, seq: session.seq, changes: session.pending });
+    session.pending = {};
+}
+
+function change(root, session, field, value) {
+    const [low, high] = session.data.limits[field] || [null, null];
+    if (low !== null) value = Math.max(low, value);
+    if (high !== null) value = Math.min(high, value);
+    if (value === session.values[field]) return;
+    session.values[field] = value;
+    session.pending[field] = value;
+    paint(root, session);
+    clearTimeout(session.timer);
+    session.timer = setTimeout(() => flush(session), session.data.sync_idle_ms);
+}
+
+export default function (component) {
+    const { data, parentElement, setTriggerValue } = component;
+
+    let session = sessions.get(data.date);
+    if (!session) {
+        session = { values: { ...data.log }, pending: {}, seq: data.seq, sentSeq: data.seq, timer: null };
+        sessions.set(data.date, session);
+    } else if (data.seq >= session.sentSeq) {
+        // Python has every batch we sent: take its values except unsent edits
+        session.values = { ...data.log, ...session.pending };
+        session.seq = Math.max(session.seq, data.seq);
+    }
+    session.data = data;
+    session.setTriggerValue = setTriggerValue;
+
+    let root = parentElement.querySelector(".dash");
+    if (!root) {
+        root = document.createElement("div");
+        root.className = "dash";
+        root.innerHTML = MARKUP;
+        parentElement.appendChild(root);
+    }
+
+    const onClick = (event) => {
+        const step = event.target.closest("[data-step]");
+        if (step) {
+            const field = step.dataset.step;
+            const size = session.data.limits[field][2];
+            change(root, session, field, session.values[field] + size * Number(step.dataset.sign));
+            return;
+        }
+        const item = event.target.closest("[data-toggle]");
+        if (item) {
+            change(root, session, item.dataset.toggle, !session.values[item.dataset.toggle]);
+        }
+    };
+    const onInput = (event) => {
+        const range = event.target.closest("[data-range]");
+        if (range) {
+            change(root, session, range.dataset.range, Number(range.value));
+        }
+    };
+    const onHide = () => flush(session);
+    const onVisibility = () => {
+        if (document.visibilityState === "hidden") flush(session);
+    };
+
+    root.querySelectorAll("[data-range]").forEach((el) => {
+        const [low, high, size] = data.limits[el.dataset.range];
+        Object.assign(el, { min: low, max: high, step: size });
+    });
+    paint(root, session);
+
+    root.addEventListener("click", onClick);
+    root.addEventListener("input", onInput);
+    window.addEventListener("blur", onHide);
+    window.addEventListener("pagehide", onHide);
+    document.addEventListener("visibilitychange", onVisibility);
+
+    return () => {
+        root.removeEventListener("click", onClick);
+        root.removeEventListener("input", onInput);
+        window.removeEventListener("blur", onHide);
+        window.removeEventListener("pagehide", onHide);
+        document.removeEventListener("visibilitychange", onVisibility);
+    };
+}